@@ -0,0 +1,236 @@
+"""Benchmark a coordinator refresh and the sensor and tracker update
+and render cycle of the Whistle integration.
+
+Entities are created through the sensor and device_tracker platform
+setup against a Home Assistant instance that is never started. The
+Whistle cloud is replaced by FixtureClient, which serves the anonymized
+single pet payload in fixtures/pet.json for any number of synthetic pets.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_update.py --pets 1 10 100 --ticks 20
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+from datetime import datetime, timedelta
+import json
+from pathlib import Path
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.whistle import device_tracker, sensor  # noqa: E402
+from custom_components.whistle.const import (  # noqa: E402
+    CONF_ZONE_METHOD,
+    DEFAULT_ZONE_METHOD,
+    DOMAIN,
+    SCHEDULER,
+    WHISTLE_COORDINATOR,
+    ZONE_METHODS,
+)
+from custom_components.whistle.coordinator import WhistleDataUpdateCoordinator  # noqa: E402
+from custom_components.whistle.scheduler import WhistleScheduler  # noqa: E402
+
+FIXTURE = Path(__file__).parent / "fixtures" / "pet.json"
+
+
+class FixtureClient:
+    """Stand-in for WhistleClient serving the pet fixture. Every call
+    to get_pets moves a share of the pets and drains their battery, so
+    ticks contain a realistic mix of changed and unchanged pets.
+    """
+
+    def __init__(self, pets: int, moving: float, seed: int = 0) -> None:
+        self._fixture: dict[str, Any] = json.loads(FIXTURE.read_text())
+        self._random = random.Random(seed)
+        self._moving = moving
+        self._pets = [self._pet_entry(index) for index in range(pets)]
+        self.token: str | None = "benchmark"
+
+    def _pet_entry(self, index: int) -> dict[str, Any]:
+        """ Create the pets entry of a synthetic pet. """
+
+        pet = copy.deepcopy(self._fixture['data'])
+        pet['id'] = pet['id'] + index
+        pet['name'] = f'Pet {index}'
+        pet['device']['serial_number'] = f'W04-{index:07d}'
+        return pet
+
+    def _payload(self, key: str) -> Any:
+        """ Return a fresh copy of a fixture payload, as a decoded response would be. """
+
+        return copy.deepcopy(self._fixture[key])
+
+    async def get_pets(self) -> dict[str, Any]:
+        for pet in self._pets:
+            if self._random.random() < self._moving:
+                location = pet['last_location']
+                location['latitude'] += self._random.uniform(-0.001, 0.001)
+                location['longitude'] += self._random.uniform(-0.001, 0.001)
+                location['timestamp'] = (
+                    datetime.fromisoformat(location['timestamp'].replace('Z', '+00:00')) + timedelta(minutes=1)
+                ).strftime('%Y-%m-%dT%H:%M:%SZ')
+                location['place']['status'] = 'outside_geofence_range'
+                pet['device']['battery_level'] = max(pet['device']['battery_level'] - 1, 0)
+        return {'pets': copy.deepcopy(self._pets)}
+
+    async def get_device_data(self, device_serial: str) -> dict[str, Any]:
+        return self._payload('device')
+
+    async def get_dailies(self, pet_id: int) -> dict[str, Any]:
+        return self._payload('dailies')
+
+    async def get_dailies_daily_items(self, pet_id: int, day_number: int) -> dict[str, Any]:
+        return self._payload('events')
+
+    async def get_stats(self, pet_id: int) -> dict[str, Any]:
+        return self._payload('stats')
+
+    async def get_places(self) -> list[dict[str, Any]]:
+        return self._payload('places')
+
+    async def get_health_trends(self, pet_id: int) -> dict[str, Any]:
+        return self._payload('health')
+
+
+async def async_build(
+    hass: HomeAssistant, client: Any, zone_method: str
+) -> tuple[WhistleDataUpdateCoordinator, list[Any], dict[str, int]]:
+    """ Create a coordinator with data from the given client and every Whistle entity. """
+
+    entry = ConfigEntry(
+        version=3,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Whistle",
+        data={CONF_EMAIL: "benchmark@example.com", CONF_PASSWORD: "benchmark"},
+        source="user",
+        options={CONF_ZONE_METHOD: zone_method},
+    )
+    # Refreshes are timed without staggering or a request budget.
+    hass.data.setdefault(DOMAIN, {})[SCHEDULER] = WhistleScheduler(hass, stagger=0, request_rate=None)
+    coordinator = WhistleDataUpdateCoordinator(hass, entry)
+    coordinator.client = client
+    await coordinator.async_refresh()
+    hass.data[DOMAIN][entry.entry_id] = {WHISTLE_COORDINATOR: coordinator}
+
+    entities: list[Any] = []
+    await sensor.async_setup_entry(hass, entry, entities.extend)
+    await device_tracker.async_setup_entry(hass, entry, entities.extend)
+
+    writes = {'count': 0}
+    for index, entity in enumerate(entities):
+        entity.hass = hass
+        platform = 'device_tracker' if isinstance(entity, device_tracker.WhistleTracker) else 'sensor'
+        entity.entity_id = f'{platform}.whistle_{index}'
+        entity.async_write_ha_state = _render_writer(entity, writes)
+    return coordinator, entities, writes
+
+
+def _render_writer(entity: Any, writes: dict[str, int]):
+    """ Replace async_write_ha_state with rendering state and attributes only. """
+
+    def write() -> None:
+        writes['count'] += 1
+        entity._async_calculate_state()
+
+    return write
+
+
+async def async_tick(
+    coordinator: WhistleDataUpdateCoordinator, entities: list[Any], all_tiers: bool
+) -> tuple[float, float]:
+    """ Run one refresh and entity update cycle. Returns both durations in seconds. """
+
+    if all_tiers:
+        coordinator.reset_tiers()
+    start = time.perf_counter()
+    await coordinator.async_refresh()
+    refreshed = time.perf_counter()
+    for entity in entities:
+        entity._handle_coordinator_update()
+    return refreshed - start, time.perf_counter() - refreshed
+
+
+async def async_run(args: argparse.Namespace, pets: int) -> dict[str, Any]:
+    """ Benchmark a single pet count. """
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        coordinator, entities, writes = await async_build(
+            hass, FixtureClient(pets, args.moving), args.zone_method
+        )
+        after = tracemalloc.take_snapshot()
+        setup_bytes = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+
+        tracemalloc.reset_peak()
+        refresh_times: list[float] = []
+        update_times: list[float] = []
+        for _ in range(args.ticks):
+            refresh_time, update_time = await async_tick(coordinator, entities, args.all_tiers)
+            refresh_times.append(refresh_time)
+            update_times.append(update_time)
+        _, peak = tracemalloc.get_traced_memory()
+
+        start = time.perf_counter()
+        for entity in entities:
+            entity._async_calculate_state()
+        render_all = time.perf_counter() - start
+        tracemalloc.stop()
+
+        await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+    return {
+        'pets': pets,
+        'entities': len(entities),
+        'refresh_ms': statistics.median(refresh_times) * 1000,
+        'update_ms': statistics.median(update_times) * 1000,
+        'writes_per_tick': writes['count'] / args.ticks,
+        'render_all_ms': render_all * 1000,
+        'kib_per_entity': setup_bytes / len(entities) / 1024,
+        'peak_kib': peak / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--pets', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--ticks', type=int, default=20)
+    parser.add_argument('--moving', type=float, default=0.2, help="share of pets that move each tick")
+    parser.add_argument('--all-tiers', action='store_true', help="refetch every polling tier each tick")
+    parser.add_argument('--zone-method', choices=ZONE_METHODS, default=DEFAULT_ZONE_METHOD)
+    args = parser.parse_args()
+
+    columns = (
+        'pets', 'entities', 'refresh_ms', 'update_ms', 'writes_per_tick',
+        'render_all_ms', 'kib_per_entity', 'peak_kib',
+    )
+    print(' '.join(f'{column:>15}' for column in columns))
+    for pets in args.pets:
+        result = asyncio.run(async_run(args, pets))
+        print(' '.join(
+            f'{result[column]:>15.2f}' if isinstance(result[column], float) else f'{result[column]:>15}'
+            for column in columns
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,276 @@
+"""Offline stand-in for the Whistle API, for load and soak testing.
+
+Serves every endpoint WhistleClient.get_whistle_data uses for any number
+of synthetic pets built from fixtures/pet.json. Pets go on walks that move
+their location outside of home, drain their battery, add to their dailies
+and create events, and health grades change over time. Latency, server
+errors, 401 responses and rate limiting can be injected.
+
+Start the server and point Home Assistant at it:
+
+    python benchmarks/fake_server.py --pets 50 --latency 0.2 --error-rate 0.01
+    WHISTLE_API_BASE_URL=http://127.0.0.1:8099/api hass -c config
+
+Any email is accepted; the password "wrong" is rejected. Request counts
+per endpoint and response status are served at /_stats.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter, deque
+import copy
+from datetime import datetime, timedelta, timezone
+import json
+import math
+from pathlib import Path
+import random
+import secrets
+import time
+from typing import Any
+
+from aiohttp import web
+
+FIXTURE = Path(__file__).parent / "fixtures" / "pet.json"
+HEALTH_STATUSES = ('normal_range', 'slightly_elevated', 'elevated')
+INVALID_PASSWORD = "wrong"
+WALK_SPEED_METERS = 80
+
+
+class SyntheticPet:
+    """ Evolving state of a single synthetic pet. """
+
+    def __init__(self, fixture: dict[str, Any], index: int, rng: random.Random) -> None:
+        self.rng = rng
+        self.data = copy.deepcopy(fixture['data'])
+        self.data['id'] = self.data['id'] + index
+        self.data['name'] = f'Pet {index}'
+        self.data['device']['serial_number'] = f'W04-{index:07d}'
+        self.device = copy.deepcopy(fixture['device'])
+        self.device['device']['serial_number'] = self.data['device']['serial_number']
+        self.dailies = copy.deepcopy(fixture['dailies'])
+        self.events: list[dict[str, Any]] = []
+        self.stats = copy.deepcopy(fixture['stats'])
+        self.health = copy.deepcopy(fixture['health'])
+        self.home = (self.data['last_location']['latitude'], self.data['last_location']['longitude'])
+        self.home_place_id = self.data['last_location']['place']['id']
+        self.walk_minutes = 0.0
+        self.walk_minutes_left = 0.0
+        self.walk_distance = 0.0
+
+    def advance(self, minutes: float, now: datetime) -> None:
+        """ Move the pet forward by the given amount of simulated minutes. """
+
+        today = self.dailies['dailies'][0]
+        summary = self.data['activity_summary']
+        location = self.data['last_location']
+        battery = self.data['device']
+
+        battery['battery_level'] = max(battery['battery_level'] - minutes / 120, 0)
+        if battery['battery_level'] == 0:
+            battery['battery_level'] = 100
+        battery['battery_level'] = round(battery['battery_level'], 1)
+        self.device['device']['battery_level'] = battery['battery_level']
+        self.device['device']['battery_stats']['battery_days_left'] = round(battery['battery_level'] / 12, 1)
+        battery['last_check_in'] = now.strftime('%Y-%m-%d %H:%M:%S') + ' UTC'
+        self.data['profile']['time_zone_name'] = 'UTC'
+
+        if self.walk_minutes_left <= 0 and self.rng.random() < 1 - math.exp(-minutes / 240):
+            self.walk_minutes = self.walk_minutes_left = self.rng.uniform(15, 60)
+            self.walk_distance = 0.0
+
+        if self.walk_minutes_left > 0:
+            walked = min(minutes, self.walk_minutes_left)
+            self.walk_minutes_left -= walked
+            bearing = self.rng.uniform(0, 2 * math.pi)
+            meters = walked * WALK_SPEED_METERS
+            location['latitude'] += meters * math.cos(bearing) / 111320
+            location['longitude'] += meters * math.sin(bearing) / (111320 * math.cos(math.radians(location['latitude'])))
+            location['place'] = {'id': None, 'status': 'outside_geofence_range', 'distance': meters, 'distance_units': 'feet'}
+            miles = meters / 1609.34
+            self.walk_distance += miles
+            summary['current_minutes_active'] += round(walked)
+            today['minutes_active'] += round(walked)
+            today['distance'] = round(today['distance'] + miles, 2)
+            today['calories'] = round(today['calories'] + walked * 4, 1)
+            if self.walk_minutes_left <= 0:
+                self._finish_walk(now)
+        else:
+            summary['current_minutes_rest'] += round(minutes)
+            today['minutes_rest'] += round(minutes)
+
+        location['timestamp'] = now.strftime('%Y-%m-%dT%H:%M:%SZ')
+        location['uncertainty_meters'] = round(self.rng.uniform(5, 40), 1)
+
+        if self.rng.random() < 1 - math.exp(-minutes / 1440):
+            trend = self.rng.choice(list(self.health))
+            self.health[trend]['status'] = self.rng.choice(HEALTH_STATUSES)
+            self.health[trend]['metrics'][0]['value'] = self.rng.randint(0, 600)
+
+    def _finish_walk(self, now: datetime) -> None:
+        """ Return the pet home and record the walk as an event. """
+
+        duration = self.walk_minutes
+        started = now - timedelta(minutes=duration)
+        self.events.insert(0, {
+            'type': 'activity',
+            'title': 'Walk',
+            'start_time': started.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'end_time': now.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'data': {
+                'distance': round(self.walk_distance, 2),
+                'calories': round(duration * 4),
+                'duration': round(duration, 1),
+            },
+        })
+        location = self.data['last_location']
+        location['latitude'], location['longitude'] = self.home
+        location['place'] = {'id': self.home_place_id, 'status': 'in_geofence_range', 'distance': 0, 'distance_units': 'feet'}
+
+
+class FakeWhistle:
+    """ Fake Whistle API state and aiohttp request handlers. """
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        fixture = json.loads(FIXTURE.read_text())
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.pets = [SyntheticPet(fixture, index, self.rng) for index in range(args.pets)]
+        self.places = copy.deepcopy(fixture['places'])
+        self.tokens: dict[str, float] = {}
+        self.requests: deque[float] = deque()
+        self.stats: Counter[str] = Counter()
+        self.clock = datetime.now(timezone.utc)
+        self.last_advance = time.monotonic()
+
+    def app(self) -> web.Application:
+        """ Create the aiohttp application. """
+
+        app = web.Application(middlewares=[self.middleware])
+        app.router.add_post('/api/login', self.login)
+        app.router.add_get('/api/pets', self.get_pets)
+        app.router.add_get('/api/devices/{serial}', self.get_device)
+        app.router.add_get('/api/pets/{pet_id}/dailies', self.get_dailies)
+        app.router.add_get('/api/pets/{pet_id}/dailies/{day}/daily_items', self.get_daily_items)
+        app.router.add_get('/api/pets/{pet_id}/stats', self.get_stats)
+        app.router.add_get('/api/pets/{pet_id}/health/trends', self.get_health)
+        app.router.add_get('/api/places', self.get_places)
+        app.router.add_get('/_stats', self.get_server_stats)
+        return app
+
+    def _advance(self) -> None:
+        """ Advance all pets by the simulated time elapsed since the last request. """
+
+        elapsed = time.monotonic() - self.last_advance
+        if elapsed < 1:
+            return
+        self.last_advance += elapsed
+        minutes = elapsed / 60 * self.args.speed
+        self.clock += timedelta(minutes=minutes)
+        for pet in self.pets:
+            pet.advance(minutes, self.clock)
+
+    @web.middleware
+    async def middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        """ Inject latency, rate limiting, errors and authentication failures. """
+
+        if request.path == '/_stats':
+            return await handler(request)
+        endpoint = request.match_info.route.resource.canonical if request.match_info.route.resource else request.path
+        self.stats[f'{request.method} {endpoint}'] += 1
+        response = await self._handle(request, handler)
+        self.stats[f'status {response.status}'] += 1
+        return response
+
+    async def _handle(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        """ Apply injected faults before calling the endpoint handler. """
+
+        args = self.args
+        if args.latency or args.jitter:
+            await asyncio.sleep(max(args.latency + self.rng.uniform(-args.jitter, args.jitter), 0))
+
+        now = time.monotonic()
+        if args.rate_limit:
+            while self.requests and now - self.requests[0] > 60:
+                self.requests.popleft()
+            if len(self.requests) >= args.rate_limit:
+                return web.json_response({'errors': [{'message': 'Rate limit exceeded'}]}, status=429)
+            self.requests.append(now)
+
+        if self.rng.random() < args.error_rate:
+            return web.Response(status=500, text='<html>Internal Server Error</html>', content_type='text/html')
+
+        if request.path != '/api/login':
+            token = request.headers.get('Authorization', '').removeprefix('Bearer ')
+            expires = self.tokens.get(token)
+            if expires is None or expires < now or self.rng.random() < args.unauthorized_rate:
+                self.tokens.pop(token, None)
+                return web.json_response({'errors': [{'message': 'Unauthorized'}]}, status=401)
+            self._advance()
+        return await handler(request)
+
+    def _pet(self, request: web.Request) -> SyntheticPet:
+        """ Return the pet addressed by a request. """
+
+        pet_id = int(request.match_info['pet_id'])
+        for pet in self.pets:
+            if pet.data['id'] == pet_id:
+                return pet
+        raise web.HTTPNotFound(text=json.dumps({'errors': [{'message': 'Not found'}]}), content_type='application/json')
+
+    async def login(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        if form.get('password') == INVALID_PASSWORD:
+            return web.json_response({'errors': [{'message': 'Invalid email address or password'}]}, status=422)
+        token = secrets.token_hex(16)
+        self.tokens[token] = time.monotonic() + self.args.token_ttl
+        return web.json_response({'auth_token': token})
+
+    async def get_pets(self, request: web.Request) -> web.Response:
+        return web.json_response({'pets': [pet.data for pet in self.pets]})
+
+    async def get_device(self, request: web.Request) -> web.Response:
+        for pet in self.pets:
+            if pet.data['device']['serial_number'] == request.match_info['serial']:
+                return web.json_response(pet.device)
+        raise web.HTTPNotFound(text=json.dumps({'errors': [{'message': 'Not found'}]}), content_type='application/json')
+
+    async def get_dailies(self, request: web.Request) -> web.Response:
+        return web.json_response(self._pet(request).dailies)
+
+    async def get_daily_items(self, request: web.Request) -> web.Response:
+        return web.json_response({'daily_items': self._pet(request).events})
+
+    async def get_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self._pet(request).stats)
+
+    async def get_health(self, request: web.Request) -> web.Response:
+        return web.json_response(self._pet(request).health)
+
+    async def get_places(self, request: web.Request) -> web.Response:
+        return web.json_response(self.places)
+
+    async def get_server_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({'simulated_time': self.clock.isoformat(), 'requests': dict(self.stats)})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--pets', type=int, default=10)
+    parser.add_argument('--speed', type=float, default=1.0, help="simulated minutes per real minute")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="random +/- seconds added to the latency")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="share of requests answered with a 500")
+    parser.add_argument('--unauthorized-rate', type=float, default=0.0, help="share of requests answered with a 401")
+    parser.add_argument('--rate-limit', type=int, default=0, help="requests per minute before answering 429, 0 for none")
+    parser.add_argument('--token-ttl', type=float, default=86400, help="seconds until an auth token expires")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    web.run_app(FakeWhistle(args).app(), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Replay a recording of Whistle traffic through the coordinator and
+every Whistle entity, and report the cost of each refresh.
+
+Recordings are written to .storage/whistle.recording.<entry_id>.jsonl.gz
+in the Home Assistant configuration directory when the "Record Whistle
+data for offline replay" option is enabled.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/replay.py whistle.recording.abc.jsonl.gz --speed 0
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from bench_update import async_build  # noqa: E402
+from custom_components.whistle.const import DEFAULT_ZONE_METHOD, ZONE_METHODS  # noqa: E402
+from custom_components.whistle.recording import ReplayClient, read_recording  # noqa: E402
+
+
+async def async_run(args: argparse.Namespace) -> dict[str, Any]:
+    """ Replay a recording and time every refresh and entity update cycle. """
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        client = ReplayClient(read_recording(args.recording))
+        first = client.advance()
+        if first is None:
+            raise SystemExit(f'{args.recording} holds no records')
+
+        # The first record is used to create the entities.
+        coordinator, entities, writes = await async_build(hass, client, args.zone_method)
+        refresh_times: list[float] = []
+        update_times: list[float] = []
+        previous = first
+        recorded = client.advance()
+        while recorded is not None:
+            if args.speed:
+                await asyncio.sleep(max(recorded - previous, 0) / args.speed)
+            previous = recorded
+            coordinator.reset_tiers()
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            refreshed = time.perf_counter()
+            for entity in entities:
+                entity._handle_coordinator_update()
+            refresh_times.append(refreshed - start)
+            update_times.append(time.perf_counter() - refreshed)
+            recorded = client.advance()
+
+        await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+    if not refresh_times:
+        raise SystemExit(f'{args.recording} holds a single record, nothing to replay')
+    return {
+        'records': len(refresh_times),
+        'pets': len(coordinator.data.pets),
+        'entities': len(entities),
+        'refresh_ms': statistics.median(refresh_times) * 1000,
+        'update_ms': statistics.median(update_times) * 1000,
+        'writes_per_record': writes['count'] / len(refresh_times),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('recording', help="path of a .jsonl.gz recording")
+    parser.add_argument('--speed', type=float, default=0, help="replay speed relative to the recording, 0 for no delay")
+    parser.add_argument('--zone-method', choices=ZONE_METHODS, default=DEFAULT_ZONE_METHOD)
+    args = parser.parse_args()
+
+    result = asyncio.run(async_run(args))
+    for key, value in result.items():
+        print(f'{key:>18} {value:.2f}' if isinstance(value, float) else f'{key:>18} {value}')
+
+
+if __name__ == '__main__':
+    main()
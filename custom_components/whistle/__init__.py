@@ -1,21 +1,35 @@
 """ Whistle Component """
 from __future__ import annotations
 
+from contextlib import suppress
+import os
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+)
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import issue_registry as ir
 
 from .const import (
     CONF_ZONE_METHOD,
     DEFAULT_ZONE_METHOD,
     DOMAIN,
+    ENTRY_OPTIONS,
     LOGGER,
     PLATFORMS,
     UPDATE_LISTENER,
     WHISTLE_COORDINATOR,
 )
-from .coordinator import WhistleDataUpdateCoordinator
+from .coordinator import WhistleDataUpdateCoordinator, snapshot_store
+from .history import history_path, remove_history
+from .recording import previous_recording_path, recording_path
+from .scheduler import async_acquire_scheduler, async_release_scheduler
+from .services import async_register_services, async_unregister_services
+from .track import track_store
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -31,13 +45,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         translation_key="whistle_platform_decommission",
     )
 
-    coordinator = WhistleDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    async_acquire_scheduler(hass)
+    try:
+        coordinator = WhistleDataUpdateCoordinator(hass, entry)
+        await coordinator.history.async_load()
+        await coordinator.tracks.async_load()
+
+        async def async_save_history(event: Event) -> None:
+            """ Write pending history before Home Assistant stops. """
+
+            await coordinator.history.async_save()
+
+        entry.async_on_unload(
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, async_save_history)
+        )
+        if await coordinator.async_restore_snapshot():
+            # Entities are created from the snapshot while live data loads.
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh(), f'{DOMAIN}_{entry.entry_id}_refresh'
+            )
+        else:
+            await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Close the shared session if no other entry uses the scheduler.
+        await async_release_scheduler(hass)
+        raise
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
-        WHISTLE_COORDINATOR: coordinator
+        WHISTLE_COORDINATOR: coordinator,
+        ENTRY_OPTIONS: dict(entry.options),
     }
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async_register_services(hass)
 
     update_listener = entry.add_update_listener(async_update_options)
     hass.data[DOMAIN][entry.entry_id][UPDATE_LISTENER] = update_listener
@@ -51,12 +90,30 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         update_listener = hass.data[DOMAIN][entry.entry_id][UPDATE_LISTENER]
         update_listener()
+        await hass.data[DOMAIN][entry.entry_id][WHISTLE_COORDINATOR].history.async_save()
         del hass.data[DOMAIN][entry.entry_id]
-        if not hass.data[DOMAIN]:
-            del hass.data[DOMAIN]
+        if await async_release_scheduler(hass):
+            async_unregister_services(hass)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """ Remove data stored for a Whistle config entry. """
+
+    await snapshot_store(hass, entry.entry_id).async_remove()
+    await hass.async_add_executor_job(_remove_recording, recording_path(hass, entry.entry_id))
+    await hass.async_add_executor_job(remove_history, history_path(hass, entry.entry_id))
+    await track_store(hass, entry.entry_id).async_remove()
+
+
+def _remove_recording(path: str) -> None:
+    """ Delete the traffic recordings of a config entry if there are any. """
+
+    for recording in (path, previous_recording_path(path)):
+        with suppress(FileNotFoundError):
+            os.remove(recording)
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """ Migrate old entry. """
 
@@ -82,6 +139,10 @@ async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """ Update options. """
-    
+    """Update options. Entry updates that only store a new auth token
+    don't need a reload.
+    """
+
+    if entry.options == hass.data[DOMAIN][entry.entry_id][ENTRY_OPTIONS]:
+        return
     await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,266 @@
+""" Whistle API client for Whistle integration. """
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+import hashlib
+from http import HTTPStatus
+import os
+import re
+import time
+from typing import Any
+
+from aiohttp import ClientResponse, ClientSession
+from aiohttp.hdrs import CACHE_CONTROL, ETAG, IF_MODIFIED_SINCE, IF_NONE_MATCH, LAST_MODIFIED
+from whistleaio import WhistleClient
+from whistleaio.const import Endpoint
+from whistleaio.exceptions import WhistleError
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    API_BASE_URL_ENV,
+    LOGGER,
+    RESPONSE_CACHE_DAYS,
+    RESPONSE_CACHE_PER_PET,
+    RESPONSE_CACHE_SHARED,
+    TIMEOUT,
+)
+
+""" Endpoint of the daily items of a pet, split in its prefix and day number. """
+DAILY_ITEMS_ENDPOINT = re.compile(
+    rf'^({re.escape(Endpoint.PETS)}/[^/]+{re.escape(Endpoint.DAILIES)}/)(\d+)/daily_items$'
+)
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """ Last parsed response of an endpoint with the data needed to revalidate it. """
+
+    data: Any
+    digest: bytes
+    etag: str | None
+    last_modified: str | None
+    expires: float | None
+
+    def fresh(self) -> bool:
+        """ Determine if the response may be reused without asking Whistle. """
+
+        return self.expires is not None and time.monotonic() < self.expires
+
+    def validators(self) -> dict[str, str]:
+        """ Return the headers making a request conditional on the cached response. """
+
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers[IF_NONE_MATCH] = self.etag
+        if self.last_modified:
+            headers[IF_MODIFIED_SINCE] = self.last_modified
+        return headers
+
+
+class _TokenRejectedError(Exception):
+    """ Whistle rejected the auth token of a request. """
+
+
+def _cache_lifetime(cache_control: str | None) -> float | None:
+    """Return the number of seconds a response may be reused according
+    to its Cache-Control header, 0 if it must be revalidated, or None if
+    it must not be stored.
+    """
+
+    directives = {
+        name.strip().lower(): value.strip().strip('"')
+        for name, _, value in (part.partition('=') for part in (cache_control or '').split(','))
+    }
+    if 'no-store' in directives:
+        return None
+    if 'no-cache' in directives:
+        return 0
+    try:
+        return max(float(directives.get('max-age', 0)), 0)
+    except ValueError:
+        return 0
+
+
+class WhistleApiClient(WhistleClient):
+    """WhistleClient that sends requests to a configurable base URL and
+    raises WhistleError for HTTP error responses instead of returning
+    the error body as data. The size of all received response bodies is
+    counted in bytes_received.
+
+    An existing auth token can be handed to the client. A new token is
+    only requested if there is none or Whistle rejects it with a 401, and
+    token_listener is called with every new token so it can be stored.
+
+    The last response of every GET endpoint is cached. It is reused
+    without a request while Cache-Control allows it, and revalidated with
+    its ETag or Last-Modified date otherwise. A body identical to the
+    cached one is not parsed again, and the cached object is returned
+    for unchanged responses so callers can skip work by identity.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        base_url: str = Endpoint.BASE_URL,
+        token: str | None = None,
+        token_listener: Callable[[str], None] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.base_url = base_url
+        self.bytes_received = 0
+        self.token = token
+        self.token_listener = token_listener
+        self._login_lock = asyncio.Lock()
+        self._cache: dict[str, CachedResponse] = {}
+        self._pet_count = 0
+
+    async def get_token(self) -> None:
+        """ Log in to get a new auth token. Concurrent callers share a single login. """
+
+        token = self.token
+        async with self._login_lock:
+            if self.token != token:
+                return
+            await super().get_token()
+        if self.token_listener and self.token:
+            self.token_listener(self.token)
+
+    async def _post(self, endpoint: str, header: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
+        """ Make POST call to Whistle servers. """
+
+        async with self._session.post(
+            url=f'{self.base_url}{endpoint}', headers=header,
+                data=data, timeout=self.timeout) as resp:
+            self.bytes_received += len(await resp.read())
+            return await self._response(resp)
+
+    async def _get(self, endpoint: str, header: dict[str, Any]) -> dict[str, Any]:
+        """Make GET call to Whistle servers. If the auth token was rejected,
+        log in again and retry once.
+        """
+
+        cached = self._cache.get(endpoint)
+        if cached is not None and cached.fresh():
+            return cached.data
+
+        token = self.token
+        try:
+            return await self._get_cached(endpoint, header, cached)
+        except _TokenRejectedError:
+            pass
+
+        if self.token == token:
+            LOGGER.debug("Whistle auth token was rejected, logging in again")
+            await self.get_token()
+        header = await self.create_header()
+        try:
+            return await self._get_cached(endpoint, header, cached)
+        except _TokenRejectedError as error:
+            raise WhistleError("Whistle rejected a new auth token") from error
+
+    async def _get_cached(
+        self, endpoint: str, header: dict[str, Any], cached: CachedResponse | None
+    ) -> dict[str, Any]:
+        """Make a GET call, conditional on the cached response if there is
+        one, and return the cached data if the response did not change.
+        """
+
+        if cached is not None:
+            header = {**header, **cached.validators()}
+        async with self._session.get(
+            url=f'{self.base_url}{endpoint}', headers=header,
+                timeout=self.timeout) as resp:
+            body = await resp.read()
+            self.bytes_received += len(body)
+            if resp.status == HTTPStatus.UNAUTHORIZED:
+                raise _TokenRejectedError
+            lifetime = _cache_lifetime(resp.headers.get(CACHE_CONTROL))
+            if cached is not None and resp.status == HTTPStatus.NOT_MODIFIED:
+                self._store(endpoint, cached.data, cached.digest, resp, lifetime, cached)
+                return cached.data
+            if resp.status != HTTPStatus.OK:
+                return await self._response(resp)
+
+            digest = hashlib.blake2b(body, digest_size=16).digest()
+            if cached is not None and cached.digest == digest:
+                data = cached.data
+            else:
+                data = await self._response(resp)
+            self._store(endpoint, data, digest, resp, lifetime, cached)
+            return data
+
+    def _store(
+        self,
+        endpoint: str,
+        data: Any,
+        digest: bytes,
+        resp: ClientResponse,
+        lifetime: float | None,
+        cached: CachedResponse | None,
+    ) -> None:
+        """Cache the response of an endpoint, keeping validators of the
+        previous response that were not sent again. The least recently
+        stored endpoint is evicted if the cache is full.
+        """
+
+        self._cache.pop(endpoint, None)
+        if endpoint == Endpoint.PETS and isinstance(data, dict) and isinstance(data.get('pets'), list):
+            self._pet_count = len(data['pets'])
+        if lifetime is None:
+            return
+        if match := DAILY_ITEMS_ENDPOINT.match(endpoint):
+            self._prune_daily_items(match[1], int(match[2]))
+        self._cache[endpoint] = CachedResponse(
+            data=data,
+            digest=digest,
+            etag=resp.headers.get(ETAG, cached.etag if cached else None),
+            last_modified=resp.headers.get(LAST_MODIFIED, cached.last_modified if cached else None),
+            expires=time.monotonic() + lifetime if lifetime else None,
+        )
+        while len(self._cache) > RESPONSE_CACHE_SHARED + RESPONSE_CACHE_PER_PET * max(self._pet_count, 1):
+            del self._cache[next(iter(self._cache))]
+
+    def _prune_daily_items(self, prefix: str, day_number: int) -> None:
+        """ Drop cached daily items of a pet for days that are no longer current. """
+
+        for endpoint in [key for key in self._cache if key.startswith(prefix)]:
+            match = DAILY_ITEMS_ENDPOINT.match(endpoint)
+            if match and int(match[2]) <= day_number - RESPONSE_CACHE_DAYS:
+                del self._cache[endpoint]
+
+    @staticmethod
+    async def _response(resp: ClientResponse) -> dict[str, Any] | None:
+        """ Check response for any errors & return original response if none """
+
+        if resp.status >= 400 and resp.status != 422:
+            raise WhistleError(f'Whistle servers returned status {resp.status} for endpoint {resp.url}')
+        return await WhistleClient._response(resp)
+
+
+def create_client(
+    hass: HomeAssistant,
+    email: str,
+    password: str,
+    token: str | None = None,
+    token_listener: Callable[[str], None] | None = None,
+    session: ClientSession | None = None,
+) -> WhistleApiClient:
+    """Create a Whistle client using the given session, or the shared
+    Home Assistant session. The API base URL can be overridden with the
+    WHISTLE_API_BASE_URL environment variable.
+    """
+
+    return WhistleApiClient(
+        email,
+        password,
+        session=session or async_get_clientsession(hass),
+        timeout=TIMEOUT,
+        base_url=os.environ.get(API_BASE_URL_ENV, Endpoint.BASE_URL),
+        token=token,
+        token_listener=token_listener,
+    )
@@ -0,0 +1,81 @@
+""" Circuit breaker around the Whistle cloud for Whistle integration. """
+from __future__ import annotations
+
+from enum import StrEnum
+import random
+import time
+
+
+class BreakerState(StrEnum):
+    """ State of a CircuitBreaker. """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker with exponential backoff and full jitter.
+
+    Every failure schedules the next attempt after a random delay between
+    zero and the base delay doubled for each consecutive failure, capped
+    at the maximum delay. Once the failure threshold is reached the breaker
+    opens and no requests are allowed until that delay has passed. The
+    next request is then a half-open probe that closes the breaker if it
+    succeeds and opens it again if it fails.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        base_delay: float,
+        max_delay: float,
+        min_delay: float = 1.0,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._min_delay = min_delay
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.failing_since: float | None = None
+        self._retry_at = 0.0
+
+    def allow_request(self) -> bool:
+        """ Determine if a request may be made, moving an open breaker to half-open once its delay passed. """
+
+        if self.state is BreakerState.OPEN:
+            if time.monotonic() < self._retry_at:
+                return False
+            self.state = BreakerState.HALF_OPEN
+        return True
+
+    def record_success(self) -> None:
+        """ Close the breaker after a successful request. """
+
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.failing_since = None
+
+    def record_failure(self) -> float:
+        """ Count a failed request. Returns the delay in seconds before the next attempt. """
+
+        now = time.monotonic()
+        if self.failing_since is None:
+            self.failing_since = now
+        self.failures += 1
+        delay = max(
+            random.uniform(0, min(self._base_delay * 2 ** (self.failures - 1), self._max_delay)),
+            self._min_delay,
+        )
+        self._retry_at = now + delay
+        if self.state is BreakerState.HALF_OPEN or self.failures >= self._failure_threshold:
+            self.state = BreakerState.OPEN
+        return delay
+
+    def failing_for(self) -> float:
+        """ Return the number of seconds since the first of the consecutive failures, or 0. """
+
+        if self.failing_since is None:
+            return 0.0
+        return time.monotonic() - self.failing_since
@@ -8,20 +8,28 @@ from whistleaio.exceptions import WhistleAuthError
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_TOKEN
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
 from .const import (
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_RECORD_TRAFFIC,
     CONF_ZONE_METHOD,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_NAME,
+    DEFAULT_RECORD_TRAFFIC,
     DEFAULT_ZONE_METHOD,
     DOMAIN,
     ZONE_METHODS,
 )
 
-from .util import async_validate_api, NoPetsError
+from .util import async_cache_pets, async_validate_api, NoPetsError
 
 DATA_SCHEMA = vol.Schema(
     {
@@ -63,7 +71,7 @@ class WhistleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             email = user_input[CONF_EMAIL]
             password = user_input[CONF_PASSWORD]
             try:
-                await async_validate_api(self.hass, email, password)
+                token, pets = await async_validate_api(self.hass, email, password)
             except WhistleAuthError:
                 errors["base"] = "invalid_auth"
             except ConnectionError:
@@ -73,12 +81,13 @@ class WhistleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 assert self.entry is not None
 
+                async_cache_pets(self.hass, email, pets)
                 self.hass.config_entries.async_update_entry(
                     self.entry,
                     data={
                         CONF_EMAIL: email,
                         CONF_PASSWORD: password,
-
+                        CONF_TOKEN: token,
                     },
                 )
                 await self.hass.config_entries.async_reload(self.entry.entry_id)
@@ -103,7 +112,7 @@ class WhistleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             email = user_input[CONF_EMAIL]
             password = user_input[CONF_PASSWORD]
             try:
-                await async_validate_api(self.hass, email, password)
+                token, pets = await async_validate_api(self.hass, email, password)
             except WhistleAuthError:
                 errors["base"] = "invalid_auth"
             except ConnectionError:
@@ -114,9 +123,10 @@ class WhistleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 await self.async_set_unique_id(email)
                 self._abort_if_unique_id_configured()
 
+                async_cache_pets(self.hass, email, pets)
                 return self.async_create_entry(
                     title=DEFAULT_NAME,
-                    data={CONF_EMAIL: email, CONF_PASSWORD: password},
+                    data={CONF_EMAIL: email, CONF_PASSWORD: password, CONF_TOKEN: token},
                     options={CONF_ZONE_METHOD: DEFAULT_ZONE_METHOD},
                 )
 
@@ -135,8 +145,14 @@ class WhistleOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         """ Manage options. """
+
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            if user_input[CONF_MIN_SCAN_INTERVAL] > user_input[CONF_MAX_SCAN_INTERVAL]:
+                errors["base"] = "invalid_scan_interval"
+            else:
+                return self.async_create_entry(title="", data=user_input)
 
         options = {
             vol.Optional(
@@ -144,7 +160,35 @@ class WhistleOptionsFlowHandler(config_entries.OptionsFlow):
                 default=self.config_entry.options.get(
                     CONF_ZONE_METHOD, DEFAULT_ZONE_METHOD
                 ),
-            ): vol.In(ZONE_METHODS)
+            ): vol.In(ZONE_METHODS),
+            vol.Optional(
+                CONF_MAX_CONCURRENT_REQUESTS,
+                default=self.config_entry.options.get(
+                    CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+            vol.Optional(
+                CONF_MIN_SCAN_INTERVAL,
+                default=self.config_entry.options.get(
+                    CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+            vol.Optional(
+                CONF_MAX_SCAN_INTERVAL,
+                default=self.config_entry.options.get(
+                    CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+            vol.Optional(
+                CONF_RECORD_TRAFFIC,
+                default=self.config_entry.options.get(
+                    CONF_RECORD_TRAFFIC, DEFAULT_RECORD_TRAFFIC
+                ),
+            ): bool,
         }
 
-        return self.async_show_form(step_id="init", data_schema=vol.Schema(options))
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(options),
+            errors=errors,
+        )
@@ -7,11 +7,13 @@ from aiohttp.client_exceptions import ClientConnectionError
 
 from homeassistant.const import Platform
 
-from whistleaio.exceptions import WhistleAuthError
+from whistleaio.exceptions import WhistleAuthError, WhistleError
 
 LOGGER = logging.getLogger(__package__)
 
 DEFAULT_SCAN_INTERVAL = 60
+MEDIUM_SCAN_INTERVAL = 300
+SLOW_SCAN_INTERVAL = 3600
 DOMAIN = "whistle"
 PLATFORMS = [
     Platform.DEVICE_TRACKER,
@@ -21,15 +23,154 @@ PLATFORMS = [
 DEFAULT_NAME = "Whistle"
 TIMEOUT = 20
 
+""" Environment variable overriding the Whistle API base URL, e.g. to use a local stand-in server. """
+API_BASE_URL_ENV = "WHISTLE_API_BASE_URL"
+
 WHISTLE_ERRORS = (
     asyncio.TimeoutError,
     ClientConnectionError,
     WhistleAuthError,
+    WhistleError,
 )
 
 CONF_ZONE_METHOD = "zone_method"
 DEFAULT_ZONE_METHOD = "Whistle"
-ZONE_METHODS = ["Whistle", "Home Assistant"]
+ZONE_METHOD_LOCAL = "Local"
+ZONE_METHODS = ["Whistle", "Home Assistant", ZONE_METHOD_LOCAL]
+
+""" Local zone method. Geofences are bucketed in a grid of
+GEOFENCE_GRID_DEGREES cells and a pet leaves a geofence once it is
+GEOFENCE_HYSTERESIS meters outside of it.
+"""
+GEOFENCE_GRID_DEGREES = 0.01
+GEOFENCE_HYSTERESIS = 20
+
+""" Polling tiers. The fast tier is refreshed on every coordinator update,
+so only the medium and slow tiers have their own interval.
+"""
+TIER_FAST = "fast"
+TIER_MEDIUM = "medium"
+TIER_SLOW = "slow"
+TIER_INTERVALS = {
+    TIER_MEDIUM: MEDIUM_SCAN_INTERVAL,
+    TIER_SLOW: SLOW_SCAN_INTERVAL,
+}
+
+""" Sections of pet data that entities subscribe to for change detection. """
+SECTION_ACTIVITY_SUMMARY = "activity_summary"
+SECTION_DAILIES = "dailies"
+SECTION_DEVICE = "device"
+SECTION_EVENTS = "events"
+SECTION_HEALTH = "health"
+SECTION_LAST_LOCATION = "last_location"
+SECTION_PLACES = "places"
+SECTION_STATS = "stats"
+
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MIN_SCAN_INTERVAL = 30
+DEFAULT_MAX_SCAN_INTERVAL = 600
+
+""" Adaptive polling. A pet counts as active if its latest event ended
+within ACTIVE_EVENT_WINDOW seconds, or if it is outside of a Whistle
+place. Events of trackers at or below LOW_BATTERY_LEVEL percent report
+too rarely to justify fast polling.
+"""
+ACTIVE_EVENT_WINDOW = 900
+LOW_BATTERY_LEVEL = 5
+
+""" While any pet is outside of a Whistle place, only the locations of
+the pets are polled every LOCATION_SCAN_INTERVAL seconds in between
+regular updates.
+"""
+LOCATION_SCAN_INTERVAL = 10
+
+""" Snapshot of the last good data that is restored on startup. """
+SNAPSHOT_SAVE_DELAY = 300
+STORAGE_VERSION = 1
+
+""" Circuit breaker. After BREAKER_FAILURE_THRESHOLD consecutive failed
+refreshes the breaker opens and refreshes skip the Whistle API until the
+retry delay passed. Retries are delayed by full jitter exponential backoff
+starting at BACKOFF_BASE_DELAY, up to BACKOFF_MAX_DELAY seconds. Last known
+data is served, marked stale, for at most STALE_DATA_MAX_AGE seconds.
+"""
+ATTR_STALE = "stale"
+ATTR_STALE_SINCE = "stale_since"
+BACKOFF_BASE_DELAY = 60
+BACKOFF_MAX_DELAY = 1800
+BREAKER_FAILURE_THRESHOLD = 3
+STALE_DATA_MAX_AGE = 21600
+
+""" Pets listed while validating credentials are reused by the first
+refresh if it starts within PETS_CACHE_MAX_AGE seconds.
+"""
+PETS_CACHE = f"{DOMAIN}_pets_cache"
+PETS_CACHE_MAX_AGE = 60
+
+""" Number of refreshes kept in the metrics ring buffer. """
+METRICS_BUFFER_SIZE = 100
+
+""" Bus event fired for every new Whistle event of a pet. The most recent
+EVENT_LOG_SIZE events of each pet are remembered to recognize new ones.
+"""
+EVENT_LOG_SIZE = 100
+EVENT_WHISTLE = "whistle_event"
+
+""" Daily activity and health history, saved HISTORY_SAVE_DELAY seconds
+after it changed and queried with the get_history service.
+"""
+HISTORY_SAVE_DELAY = 300
+PERIOD_DAY = "day"
+PERIOD_MONTH = "month"
+PERIOD_WEEK = "week"
+PERIODS = [PERIOD_DAY, PERIOD_WEEK, PERIOD_MONTH]
+SERVICE_GET_HISTORY = "get_history"
+
+""" GPS track of the last TRACK_SIZE location fixes of each pet, saved
+TRACK_SAVE_DELAY seconds after it changed and queried with the get_track
+service. Points closer than TRACK_TOLERANCE meters to the simplified
+track are left out unless another tolerance is requested.
+"""
+SERVICE_GET_TRACK = "get_track"
+TRACK_SAVE_DELAY = 300
+TRACK_SIZE = 2000
+TRACK_TOLERANCE = 5
+
+""" Opt-in recording of every refresh result for offline replay. A
+recording is rotated once it reaches RECORDING_MAX_SIZE bytes.
+"""
+CONF_RECORD_TRAFFIC = "record_traffic"
+DEFAULT_RECORD_TRAFFIC = False
+RECORDING_MAX_SIZE = 20 * 1024 * 1024
+
+ENTRY_OPTIONS = "entry_options"
+""" Shared by all config entries. Refreshes start at least REFRESH_STAGGER
+seconds apart and all entries together make at most REQUEST_BUDGET_RATE
+requests per second, with bursts of up to REQUEST_BUDGET_BURST requests.
+"""
+CONNECTION_KEEPALIVE = 60
+CONNECTION_LIMIT_PER_HOST = 8
+REFRESH_STAGGER = 2
+REQUEST_BUDGET_BURST = 30
+REQUEST_BUDGET_RATE = 10
+SCHEDULER = "scheduler"
+
+""" Number of parsed timestamps that are remembered, so unchanged check-in
+and event times are not parsed again.
+"""
+TIMESTAMP_CACHE_SIZE = 512
+
+""" The response cache holds at most RESPONSE_CACHE_PER_PET endpoints per
+pet plus RESPONSE_CACHE_SHARED endpoints shared by all pets. Daily items
+are only kept for the RESPONSE_CACHE_DAYS most recent days of a pet.
+"""
+RESPONSE_CACHE_DAYS = 2
+RESPONSE_CACHE_PER_PET = 8
+RESPONSE_CACHE_SHARED = 2
 
 UPDATE_LISTENER = "update_listener"
 WHISTLE_COORDINATOR = "whistle_coordinator"
@@ -1,21 +1,142 @@
 """ DataUpdateCoordinator for the Whistle integration. """
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
+from datetime import datetime, timedelta
+import time
+from typing import Any, TypeVar
 
-from whistleaio import WhistleClient
+from aiohttp import ClientError
 from whistleaio.exceptions import WhistleAuthError, WhistleError
-from whistleaio.model import WhistleData
+from whistleaio.model import Pet, WhistleData
 
 
+from homeassistant.components.zone import DOMAIN as ZONE_DOMAIN
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    ATTR_LATITUDE,
+    ATTR_LONGITUDE,
+    ATTR_NAME,
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    CONF_TOKEN,
+    STATE_HOME,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ACTIVE_EVENT_WINDOW,
+    BACKOFF_BASE_DELAY,
+    BACKOFF_MAX_DELAY,
+    BREAKER_FAILURE_THRESHOLD,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_RECORD_TRAFFIC,
+    CONF_ZONE_METHOD,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_RECORD_TRAFFIC,
+    DEFAULT_ZONE_METHOD,
+    DOMAIN,
+    EVENT_LOG_SIZE,
+    EVENT_WHISTLE,
+    GEOFENCE_GRID_DEGREES,
+    GEOFENCE_HYSTERESIS,
+    LOCATION_SCAN_INTERVAL,
+    LOGGER,
+    LOW_BATTERY_LEVEL,
+    METRICS_BUFFER_SIZE,
+    SECTION_ACTIVITY_SUMMARY,
+    SECTION_DAILIES,
+    SECTION_DEVICE,
+    SECTION_EVENTS,
+    SECTION_HEALTH,
+    SECTION_LAST_LOCATION,
+    SECTION_PLACES,
+    SECTION_STATS,
+    SNAPSHOT_SAVE_DELAY,
+    STALE_DATA_MAX_AGE,
+    STORAGE_VERSION,
+    TIER_FAST,
+    TIER_INTERVALS,
+    TIER_MEDIUM,
+    TIER_SLOW,
+    ZONE_METHOD_LOCAL,
+)
+from .api import create_client
+from .breaker import BreakerState, CircuitBreaker
+from .events import PetEventLog
+from .geofence import Geofence, GeofenceEngine
+from .history import HistoryStore
+from .metrics import RefreshMetricsBuffer
+from .model import PetSnapshot
+from .recording import TrafficRecorder, recording_path
+from .scheduler import async_get_scheduler
+from .statistics import StatisticsImporter
+from .track import TrackStore
+from .util import async_pop_cached_pets, fingerprint, parse_timestamp
+
+_T = TypeVar("_T")
+
+""" Sections fetched by their own request, refetched while they are failing. """
+MEDIUM_SECTIONS = frozenset({SECTION_DEVICE, SECTION_DAILIES, SECTION_EVENTS})
+SLOW_SECTIONS = frozenset({SECTION_HEALTH, SECTION_PLACES, SECTION_STATS})
+
+""" Check the shape of a response before it replaces the last good value of a section. """
+SECTION_VALIDATORS: dict[str, Callable[[Any], bool]] = {
+    SECTION_DEVICE: lambda value: isinstance(value, dict) and isinstance(value.get('device'), dict),
+    SECTION_DAILIES: lambda value: isinstance(value, dict) and bool(value.get('dailies')),
+    SECTION_EVENTS: lambda value: isinstance(value, dict) and isinstance(value.get('daily_items'), list),
+    SECTION_HEALTH: lambda value: isinstance(value, dict),
+    SECTION_PLACES: lambda value: isinstance(value, list),
+    SECTION_STATS: lambda value: isinstance(value, dict),
+}
+
+SECTIONS: dict[str, Callable[[Pet], Any]] = {
+    SECTION_ACTIVITY_SUMMARY: lambda pet: pet.data.get('activity_summary'),
+    SECTION_DAILIES: lambda pet: pet.dailies,
+    SECTION_DEVICE: lambda pet: (pet.data.get('device'), pet.device),
+    SECTION_EVENTS: lambda pet: pet.events,
+    SECTION_HEALTH: lambda pet: pet.health,
+    SECTION_LAST_LOCATION: lambda pet: pet.data.get('last_location'),
+    SECTION_PLACES: lambda pet: pet.places,
+}
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """ Return the store holding the data snapshot of a config entry. """
+
+    return Store(hass, STORAGE_VERSION, f'{DOMAIN}.snapshot.{entry_id}')
+
+
+def _newer_location(location: dict[str, Any], previous: dict[str, Any] | None) -> bool:
+    """ Determine if a location has a later timestamp than the previous location of a pet. """
+
+    try:
+        timestamp = parse_timestamp(location['timestamp'])
+    except (KeyError, AttributeError, ValueError):
+        return False
+    try:
+        return timestamp > parse_timestamp(previous['timestamp'])
+    except (KeyError, AttributeError, TypeError, ValueError):
+        return True
+
+
+def _outside_place(pet: Pet) -> bool:
+    """ Determine if Whistle reports a pet outside of all its places. """
+
+    place = (pet.data.get('last_location') or {}).get('place') or {}
+    return place.get('status') == 'outside_geofence_range'
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, LOGGER, TIMEOUT
 
 class WhistleDataUpdateCoordinator(DataUpdateCoordinator):
     """ Whistle Data Update Coordinator. """
@@ -25,30 +146,736 @@ class WhistleDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """ Initialize the Whistle coordinator. """
 
-        self.client = WhistleClient(
+        self._entry = entry
+        self._scheduler = async_get_scheduler(hass)
+        self.client = create_client(
+            hass,
             entry.data[CONF_EMAIL],
             entry.data[CONF_PASSWORD],
-            session=async_get_clientsession(hass),
-            timeout=TIMEOUT,
+            token=entry.data.get(CONF_TOKEN),
+            token_listener=self._save_token,
+            session=self._scheduler.session,
+        )
+        self._prefetched_pets = async_pop_cached_pets(hass, entry.data[CONF_EMAIL])
+        self._store = snapshot_store(hass, entry.entry_id)
+        self._snapshot_save_pending = False
+        self._tier_fetched: dict[str, datetime] = {}
+        self._retry_pets: set[str] = set()
+        self.section_failures: dict[str, dict[str, datetime]] = {}
+        self._fingerprints: dict[str, dict[str, int]] = {}
+        self._section_values: dict[str, dict[str, Any]] = {}
+        self.changed_sections: dict[str, frozenset[str]] = {}
+        self.snapshots: dict[str, PetSnapshot] = {}
+        self.place_names: dict[str, dict[int, str]] = {}
+        self.event_logs: dict[str, PetEventLog] = {}
+        self.history = HistoryStore(hass, entry.entry_id)
+        self._statistics = StatisticsImporter(hass)
+        self.tracks = TrackStore(hass, entry.entry_id)
+        self._late_events: dict[str, list[dict[str, Any]]] = {}
+        self.zone_method: str = entry.options.get(CONF_ZONE_METHOD, DEFAULT_ZONE_METHOD)
+        self._geofences = GeofenceEngine(GEOFENCE_GRID_DEGREES, GEOFENCE_HYSTERESIS)
+        self._geofence_signature: tuple[Geofence, ...] | None = None
+        self._place_geofences: tuple[Geofence, ...] = ()
+        self._min_interval: int = entry.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
+        self._max_interval: int = entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+        self._polling_interval: float = self._min_interval
+        self._breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BACKOFF_BASE_DELAY, BACKOFF_MAX_DELAY)
+        self.stale = False
+        self._cancel_location_poll: CALLBACK_TYPE | None = None
+        self._refreshing = False
+        self._refreshes_started = 0
+        self.metrics = RefreshMetricsBuffer(METRICS_BUFFER_SIZE)
+        self._recorder: TrafficRecorder | None = None
+        if entry.options.get(CONF_RECORD_TRAFFIC, DEFAULT_RECORD_TRAFFIC):
+            self._recorder = TrafficRecorder(hass, recording_path(hass, entry.entry_id))
+        self._semaphore = asyncio.Semaphore(
+            entry.options.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS)
         )
         super().__init__(
             hass,
             LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=timedelta(seconds=self._min_interval),
         )
 
     async def _async_update_data(self) -> WhistleData:
-        """ Fetch data from Whistle. """
+        """ Fetch data from Whistle and record metrics of the refresh. """
 
+        await self._scheduler.async_wait_for_turn()
+        metrics = self.metrics.start(dt_util.utcnow())
+        bytes_received = self._bytes_received()
+        start = time.perf_counter()
+        # Location polls don't apply their results while a refresh runs.
+        self._refreshes_started += 1
+        self._refreshing = True
         try:
-            data = await self.client.get_whistle_data()
+            data = await self._async_fetch_data()
+        except Exception as error:
+            self.metrics.failed(metrics, error)
+            raise
+        finally:
+            self._refreshing = False
+            metrics.duration_ms = (time.perf_counter() - start) * 1000
+            metrics.bytes_received = self._bytes_received() - bytes_received
+        metrics.pets = len(data.pets)
+        metrics.stale = self.stale
+        LOGGER.debug(
+            f'Whistle refresh took {metrics.duration_ms:.0f} ms for {metrics.pets} pets, '
+            f'received {metrics.bytes_received} bytes'
+        )
+        return data
+
+    def _bytes_received(self) -> int:
+        """ Return the total size of responses received by the client. """
+
+        return getattr(self.client, 'bytes_received', 0)
+
+    async def _async_fetch_data(self) -> WhistleData:
+        """ Fetch data from Whistle, unless the circuit breaker is open. """
+
+        if not self._breaker.allow_request():
+            return self._stale_data("circuit breaker is open")
+        try:
+            data = await self._async_fetch_tiers()
         except WhistleAuthError as error:
             raise ConfigEntryAuthFailed from error
-        except WhistleError as error:
-            raise UpdateFailed(error) from error
+        except (WhistleError, ClientError, asyncio.TimeoutError) as error:
+            return self._handle_failure(error)
         except Exception as error:
-            raise UpdateFailed(error) from error
+            raise UpdateFailed(f'Unexpected error fetching Whistle data: {error!r}') from error
         if not data.pets:
             raise UpdateFailed("No Pets found")
+        if self._breaker.state is not BreakerState.CLOSED:
+            LOGGER.info("Whistle is reachable again, closing circuit breaker")
+        elif self._breaker.failures:
+            LOGGER.info("Whistle is reachable again")
+        self._breaker.record_success()
+        self.stale = False
+        self._detect_changes(data)
+        self._index_places(data)
+        self._ingest_events(data)
+        if self.history.async_update(data, self.changed_sections):
+            self._statistics.async_import(
+                self.history, {pet_id: pet.data['name'] for pet_id, pet in data.pets.items()}
+            )
+        self.tracks.async_update(data, self.changed_sections)
+        self._adapt_update_interval(data)
+        self._schedule_location_poll(data)
+        self._schedule_snapshot_save()
+        if self._recorder:
+            self.hass.async_create_background_task(
+                self._recorder.async_record(data), f'{DOMAIN}_record_traffic'
+            )
         return data
+
+    @callback
+    def _save_token(self, token: str) -> None:
+        """ Store a new auth token in the config entry, so it is reused after a restart. """
+
+        if token != self._entry.data.get(CONF_TOKEN):
+            self.hass.config_entries.async_update_entry(
+                self._entry, data={**self._entry.data, CONF_TOKEN: token}
+            )
+
+    def _handle_failure(self, error: Exception) -> WhistleData:
+        """Back off after a refresh failed to reach Whistle. Last known data
+        is returned marked stale instead of failing, so entities keep their
+        values. The first failure and the breaker opening are logged as
+        warnings, later failures only at debug level.
+        """
+
+        was_closed = self._breaker.state is BreakerState.CLOSED
+        delay = self._breaker.record_failure()
+        self.update_interval = timedelta(seconds=delay)
+        if self._breaker.failures == 1:
+            LOGGER.warning(f'Failed to update Whistle data, using last known data: {error}')
+        if was_closed and self._breaker.state is BreakerState.OPEN:
+            LOGGER.warning(
+                f'Whistle refresh failed {self._breaker.failures} times in a row, '
+                f'opening circuit breaker and retrying in {delay:.0f} seconds: {error}'
+            )
+        else:
+            LOGGER.debug(
+                f'Whistle refresh failed {self._breaker.failures} times in a row, '
+                f'circuit breaker is {self._breaker.state}, retrying in {delay:.0f} seconds: {error}'
+            )
+        if self.data is None:
+            raise UpdateFailed(error) from error
+        if metrics := self.metrics.latest:
+            self.metrics.failed(metrics, error)
+        return self._stale_data(str(error))
+
+    def _stale_data(self, reason: str) -> WhistleData:
+        """Return the last known data marked stale, as long as refreshes
+        have not been failing for longer than the maximum stale age.
+        """
+
+        if self.data is None or self._breaker.failing_for() > STALE_DATA_MAX_AGE:
+            raise UpdateFailed(f'Whistle is unavailable: {reason}')
+        self.stale = True
+        self.changed_sections = {}
+        return self.data
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last good WhistleData saved to disk so entities can
+        be created before the first live refresh. Returns True if restored.
+        """
+
+        snapshot = await self._store.async_load()
+        if not snapshot:
+            return False
+        try:
+            data = WhistleData(
+                pets={pet_id: Pet(**pet, stats={}) for pet_id, pet in snapshot['pets'].items()}
+            )
+        except (KeyError, TypeError) as error:
+            LOGGER.warning(f'Ignoring invalid Whistle snapshot: {error}')
+            return False
+        if not data.pets:
+            return False
+
+        self._detect_changes(data)
+        self._index_places(data)
+        self._ingest_events(data)
+        self.data = data
+        return True
+
+    @callback
+    def _schedule_snapshot_save(self) -> None:
+        """Save a snapshot SNAPSHOT_SAVE_DELAY seconds after the first
+        refresh since the previous save. Later refreshes don't postpone the
+        pending save, so a snapshot is written regularly while data changes.
+        """
+
+        if self._snapshot_save_pending:
+            return
+        self._snapshot_save_pending = True
+        self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Create a compact snapshot of the current data when the store
+        writes it. Stats are left out as no entity uses them.
+        """
+
+        self._snapshot_save_pending = False
+        pets: dict[str, dict[str, Any]] = {}
+        for pet_id, pet in self.data.pets.items():
+            pets[pet_id] = asdict(pet)
+            del pets[pet_id]['stats']
+        return {'pets': pets}
+
+    def _adapt_update_interval(self, data: WhistleData) -> None:
+        """Poll at the minimum interval while any pet is away or active,
+        otherwise back off exponentially up to the maximum interval.
+        """
+
+        now = dt_util.utcnow()
+        if any(self._pet_is_active(pet, now) for pet in data.pets.values()):
+            seconds = self._min_interval
+        else:
+            seconds = min(self._polling_interval * 2, self._max_interval)
+        if seconds != self._polling_interval:
+            LOGGER.debug(f'Whistle update interval changed to {seconds} seconds')
+        self._polling_interval = seconds
+        self.update_interval = timedelta(seconds=seconds)
+
+    @staticmethod
+    def _pet_is_active(pet: Pet, now: datetime) -> bool:
+        """Determine if a pet is outside of a Whistle place or had an
+        event that ended recently. Events of trackers with a low battery
+        are ignored, but a pet outside of a place always counts as active.
+        """
+
+        if _outside_place(pet):
+            return True
+
+        battery_level = (pet.data.get('device') or {}).get('battery_level')
+        if battery_level is not None and battery_level <= LOW_BATTERY_LEVEL:
+            return False
+
+        if pet.events and pet.events.get('daily_items'):
+            end_time = pet.events['daily_items'][00].get('end_time')
+            if end_time is None:
+                return True
+            try:
+                ended = parse_timestamp(end_time)
+            except ValueError:
+                return False
+            return now - ended <= timedelta(seconds=ACTIVE_EVENT_WINDOW)
+        return False
+
+    @callback
+    def _schedule_location_poll(self, data: WhistleData) -> None:
+        """Schedule a location-only poll while any pet is outside of a
+        Whistle place, unless regular updates are already as frequent.
+        """
+
+        if self._cancel_location_poll is not None:
+            return
+        if self.update_interval.total_seconds() <= LOCATION_SCAN_INTERVAL:
+            return
+        if not any(_outside_place(pet) for pet in data.pets.values()):
+            return
+        self._cancel_location_poll = async_call_later(
+            self.hass, LOCATION_SCAN_INTERVAL, self._async_poll_locations
+        )
+
+    async def _async_poll_locations(self, _now: Any) -> None:
+        """Fetch the pets list and apply only the last location of every
+        pet. Only entities depending on the location are notified. The poll
+        stops once all pets are back in a place or a request fails, and
+        starts again with the next regular update. A poll is skipped, or its
+        result dropped, if a regular update runs in the meantime, and only
+        locations newer than the stored ones are applied.
+        """
+
+        self._cancel_location_poll = None
+        if self.data is None or self._refreshing or self._breaker.state is not BreakerState.CLOSED:
+            return
+        refreshes_started = self._refreshes_started
+        try:
+            # Not counted in refresh metrics, which describe regular updates.
+            # Notified entities are counted separately by metrics.location_poll.
+            async with self._semaphore:
+                await self._scheduler.budget.async_acquire()
+                response = await self.client.get_pets()
+        except Exception as error:
+            LOGGER.debug(f'Whistle location poll failed, waiting for the next update: {error}')
+            return
+        if self._refreshing or self._refreshes_started != refreshes_started:
+            # A regular update started meanwhile and schedules the next poll itself.
+            return
+
+        changed: dict[str, frozenset[str]] = {}
+        for entry in response.get('pets') or []:
+            pet_id = str(entry.get('id'))
+            pet = self.data.pets.get(pet_id)
+            location = entry.get('last_location')
+            if pet is None or not location or pet_id not in self._fingerprints:
+                continue
+            if not _newer_location(location, pet.data.get('last_location')):
+                continue
+            location_fingerprint = fingerprint(location)
+            if self._fingerprints[pet_id][SECTION_LAST_LOCATION] == location_fingerprint:
+                continue
+            self._fingerprints[pet_id][SECTION_LAST_LOCATION] = location_fingerprint
+            pet.data = {**pet.data, 'last_location': location}
+            self.snapshots[pet_id] = PetSnapshot.from_pet(pet)
+            changed[pet_id] = frozenset({SECTION_LAST_LOCATION})
+
+        if changed:
+            LOGGER.debug(f'Whistle location poll updated pets {list(changed)}')
+            self.changed_sections = changed
+            self.tracks.async_update(self.data, changed)
+            with self.metrics.location_poll():
+                self.async_update_listeners()
+        self._schedule_location_poll(self.data)
+
+    async def async_shutdown(self) -> None:
+        """ Cancel a scheduled location poll when the coordinator shuts down. """
+
+        await super().async_shutdown()
+        if self._cancel_location_poll is not None:
+            self._cancel_location_poll()
+            self._cancel_location_poll = None
+
+    def _detect_changes(self, data: WhistleData) -> None:
+        """Fingerprint each section of every pet and record which
+        sections differ from the previous refresh. Pets with changes get
+        a new PetSnapshot.
+        """
+
+        fingerprints: dict[str, dict[str, int]] = {}
+        section_values: dict[str, dict[str, Any]] = {}
+        changed: dict[str, frozenset[str]] = {}
+        for pet_id, pet in data.pets.items():
+            previous = self._fingerprints.get(pet_id, {})
+            previous_values = self._section_values.get(pet_id, {})
+            values = {section: getter(pet) for section, getter in SECTIONS.items()}
+            # The client returns the same object for unchanged responses, which needs no fingerprint.
+            current = {
+                section: previous[section]
+                if section in previous and section in previous_values and value is previous_values[section]
+                else fingerprint(value)
+                for section, value in values.items()
+            }
+            fingerprints[pet_id] = current
+            section_values[pet_id] = values
+            changed[pet_id] = frozenset(
+                section for section, value in current.items() if previous.get(section) != value
+            )
+        self._fingerprints = fingerprints
+        self._section_values = section_values
+        self.changed_sections = changed
+        self.snapshots = {
+            pet_id: PetSnapshot.from_pet(pet)
+            if changed[pet_id] or pet_id not in self.snapshots else self.snapshots[pet_id]
+            for pet_id, pet in data.pets.items()
+        }
+
+    def _index_places(self, data: WhistleData) -> None:
+        """Build a lookup of Whistle place id to place name for each pet.
+        Lookups are only rebuilt if the places of a pet changed, and pets
+        sharing identical places share a single lookup.
+        """
+
+        index: dict[str, dict[int, str]] = {}
+        built: dict[int, dict[int, str]] = {}
+        for pet_id, pet in data.pets.items():
+            if pet_id in self.place_names and SECTION_PLACES not in self.changed_sections[pet_id]:
+                index[pet_id] = self.place_names[pet_id]
+                continue
+            places_fingerprint = self._fingerprints[pet_id][SECTION_PLACES]
+            if places_fingerprint not in built:
+                built[places_fingerprint] = {place['id']: place['name'] for place in pet.places or []}
+            index[pet_id] = built[places_fingerprint]
+        if built and self.zone_method == ZONE_METHOD_LOCAL:
+            self._index_place_geofences(data)
+        self.place_names = index
+
+    def _ingest_events(self, data: WhistleData) -> None:
+        """Add the events of each pet to its event log and fire a
+        whistle_event for every event that was not seen before, and again
+        when a running event finishes. Events present when a pet's log is
+        created are recorded without firing.
+        """
+
+        for pet_id, pet in data.pets.items():
+            late_events = self._late_events.pop(pet_id, [])
+            log = self.event_logs.get(pet_id)
+            if log is not None and not late_events and SECTION_EVENTS not in self.changed_sections[pet_id]:
+                continue
+            if log is None:
+                log = self.event_logs[pet_id] = PetEventLog(EVENT_LOG_SIZE)
+                seeding = True
+            else:
+                seeding = False
+            new_events = log.add(late_events) + log.add((pet.events or {}).get('daily_items') or [])
+            if seeding:
+                continue
+            for item in new_events:
+                LOGGER.debug(f'New Whistle event for pet {pet_id}: {item.get("title")}')
+                self.hass.bus.async_fire(
+                    EVENT_WHISTLE,
+                    {
+                        'pet_id': pet_id,
+                        ATTR_NAME: pet.data.get('name'),
+                        'type': item.get('type'),
+                        'title': item.get('title'),
+                        'start_time': item.get('start_time'),
+                        'end_time': item.get('end_time'),
+                        'data': item.get('data') or {},
+                    },
+                )
+
+    @callback
+    def async_match_geofence(self, pet_id: str, latitude: float, longitude: float, accuracy: float) -> str | None:
+        """Match a pet location against Whistle places and Home Assistant
+        zones. Returns the place name, home for the home zone, or None.
+        """
+
+        geofences = self._place_geofences + self._zone_geofences()
+        if geofences != self._geofence_signature:
+            self._geofences.rebuild(geofences)
+            self._geofence_signature = geofences
+        geofence = self._geofences.match(pet_id, latitude, longitude, accuracy)
+        return geofence.name if geofence else None
+
+    def _index_place_geofences(self, data: WhistleData) -> None:
+        """ Collect Whistle places of all pets as geofences for the local zone method. """
+
+        geofences: dict[str, Geofence] = {}
+        for pet in data.pets.values():
+            for place in pet.places or []:
+                if place.get('latitude') is None or place.get('longitude') is None:
+                    continue
+                key = f"{DOMAIN}.{place['id']}"
+                geofences[key] = Geofence(
+                    key, place['name'], place['latitude'], place['longitude'], place.get('radius_meters') or 0
+                )
+        self._place_geofences = tuple(geofences.values())
+
+    @callback
+    def _zone_geofences(self) -> tuple[Geofence, ...]:
+        """ Return active Home Assistant zones as geofences. """
+
+        return tuple(
+            Geofence(
+                state.entity_id,
+                STATE_HOME if state.entity_id == f'{ZONE_DOMAIN}.{STATE_HOME}' else state.name,
+                state.attributes[ATTR_LATITUDE],
+                state.attributes[ATTR_LONGITUDE],
+                state.attributes.get('radius', 0),
+            )
+            for state in self.hass.states.async_all(ZONE_DOMAIN)
+            if not state.attributes.get('passive')
+        )
+
+    def sections_changed(self, pet_id: str, sections: frozenset[str]) -> bool:
+        """ Return True if any of the given sections changed during the last refresh. """
+
+        return not self.changed_sections.get(pet_id, frozenset()).isdisjoint(sections)
+
+    def reset_tiers(self) -> None:
+        """ Mark every polling tier as due, so the next refresh fetches all endpoints. """
+
+        self._tier_fetched.clear()
+
+    def _tier_due(self, tier: str, now: datetime) -> bool:
+        """ Determine if the endpoints in a polling tier need to be refreshed. """
+
+        last_fetched = self._tier_fetched.get(tier)
+        if last_fetched is None:
+            return True
+        return now - last_fetched >= timedelta(seconds=TIER_INTERVALS[tier])
+
+    async def _async_fetch_tiers(self) -> WhistleData:
+        """Fetch the endpoints of every polling tier that is due and
+        merge the results into the existing WhistleData.
+
+        Fast: pets (location, battery level, activity summary).
+        Medium: device, dailies, and events.
+        Slow: health trends, places, and stats.
+        """
+
+        now = dt_util.utcnow()
+        previous = self.data.pets if self.data else {}
+        medium_due = self._tier_due(TIER_MEDIUM, now)
+        slow_due = self._tier_due(TIER_SLOW, now)
+
+        if self._prefetched_pets is not None:
+            # Pets listed while validating credentials, only used by the first refresh.
+            response, self._prefetched_pets = self._prefetched_pets, None
+        else:
+            response = await self._async_request(self.client.get_pets)
+        pet_list: list[dict[str, Any]] = response['pets'] or []
+
+        # Places are shared by all pets on the account, so they are fetched once.
+        pet_ids = [str(pet['id']) for pet in pet_list]
+        places: list[dict] | None = None
+        if slow_due or any(
+            pet_id not in previous or self._section_failing(pet_id, frozenset({SECTION_PLACES}))
+            for pet_id in pet_ids
+        ):
+            places = await self._async_fetch_section(pet_ids, SECTION_PLACES, None, self.client.get_places)
+
+        results = await asyncio.gather(
+            *(
+                self._async_fetch_pet(pet, previous.get(str(pet['id'])), places, medium_due, slow_due)
+                for pet in pet_list
+            ),
+            return_exceptions=True,
+        )
+
+        pets: dict[str, Pet] = {}
+        for pet, result in zip(pet_list, results):
+            pet_id = str(pet['id'])
+            if not isinstance(result, BaseException):
+                pets[pet_id] = result
+                self._retry_pets.discard(pet_id)
+                continue
+            if isinstance(result, WhistleAuthError) or not isinstance(result, Exception):
+                raise result
+            # Refetch every tier for this pet on the next refresh.
+            self._retry_pets.add(pet_id)
+            if pet_id in previous:
+                LOGGER.warning(f'Failed to update Whistle pet {pet_id}, keeping last known data: {result}')
+                pets[pet_id] = self._merge_pet(pet, previous[pet_id])
+            else:
+                LOGGER.warning(f'Failed to fetch Whistle pet {pet_id}: {result}')
+
+        self.section_failures = {
+            pet_id: failures for pet_id, failures in self.section_failures.items() if failures and pet_id in pets
+        }
+        self._tier_fetched[TIER_FAST] = now
+        if medium_due:
+            self._tier_fetched[TIER_MEDIUM] = now
+        if slow_due:
+            self._tier_fetched[TIER_SLOW] = now
+        return WhistleData(pets=pets)
+
+    async def _async_fetch_pet(
+        self,
+        pet: dict[str, Any],
+        previous: Pet | None,
+        places: list[dict] | None,
+        medium_due: bool,
+        slow_due: bool,
+    ) -> Pet:
+        """Build a Pet from a fresh pets entry, refetching only the tiers
+        that are due. Pets seen for the first time have every tier fetched,
+        and so do tiers with a section that failed before.
+        """
+
+        pet_id = str(pet['id'])
+        if previous is None or pet_id in self._retry_pets:
+            medium_due = slow_due = True
+        medium_due = medium_due or self._section_failing(pet_id, MEDIUM_SECTIONS)
+        slow_due = slow_due or self._section_failing(pet_id, SLOW_SECTIONS)
+
+        (device, dailies, events), (stats, health) = await asyncio.gather(
+            self._async_fetch_medium(pet, previous) if medium_due
+            else self._async_previous(previous.device, previous.dailies, previous.events),
+            self._async_fetch_slow(pet, previous) if slow_due
+            else self._async_previous(previous.stats, previous.health),
+        )
+
+        return Pet(
+            id=pet_id,
+            data=pet,
+            device=device,
+            dailies=dailies,
+            events=events,
+            places=places if places is not None else previous.places if previous else None,
+            stats=stats,
+            health=health,
+        )
+
+    async def _async_fetch_medium(
+        self, pet: dict[str, Any], previous: Pet | None
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None, dict[str, Any] | None]:
+        """Fetch the device, dailies, and events of a single pet. When a
+        new day started since the previous fetch, the events of the previous
+        day are fetched once more so events from its last hours are not missed.
+        Events are fetched for the day of the dailies, so they keep their
+        last good value while no dailies are known.
+        """
+
+        pet_ids = [str(pet['id'])]
+        device, dailies = await asyncio.gather(
+            self._async_fetch_section(
+                pet_ids, SECTION_DEVICE, previous.device if previous else None,
+                self.client.get_device_data, (pet.get('device') or {}).get('serial_number'),
+            ),
+            self._async_fetch_section(
+                pet_ids, SECTION_DAILIES, previous.dailies if previous else None,
+                self.client.get_dailies, pet['id'],
+            ),
+        )
+        previous_events = previous.events if previous else None
+        if not dailies:
+            self._section_failed(pet_ids, SECTION_EVENTS, "no dailies to fetch events for")
+            return device, dailies, previous_events
+
+        day_number = dailies['dailies'][00]['day_number']
+        previous_day = previous.dailies['dailies'][00]['day_number'] if previous and previous.dailies else None
+        if previous_day is not None and previous_day != day_number and pet_ids[0] in self.event_logs:
+            late_events = await self._async_fetch_section(
+                pet_ids, SECTION_EVENTS, None, self.client.get_dailies_daily_items, pet['id'], previous_day
+            )
+            self._late_events[pet_ids[0]] = (late_events or {}).get('daily_items') or []
+        events = await self._async_fetch_section(
+            pet_ids, SECTION_EVENTS, previous_events, self.client.get_dailies_daily_items, pet['id'], day_number
+        )
+        return device, dailies, events
+
+    async def _async_fetch_slow(
+        self, pet: dict[str, Any], previous: Pet | None
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """ Fetch the stats and health trends of a single pet. """
+
+        pet_ids = [str(pet['id'])]
+        return await asyncio.gather(
+            self._async_fetch_section(
+                pet_ids, SECTION_STATS, previous.stats if previous else None, self.client.get_stats, pet['id']
+            ),
+            self._async_fetch_section(
+                pet_ids, SECTION_HEALTH, previous.health if previous else None,
+                self.client.get_health_trends, pet['id'],
+            ),
+        )
+
+    async def _async_fetch_section(
+        self,
+        pet_ids: list[str],
+        section: str,
+        fallback: _T,
+        request: Callable[..., Awaitable[_T]],
+        *args: Any,
+    ) -> _T:
+        """Fetch and validate the data of a section. If the request fails
+        or returns unexpected data, the failure is recorded for the pets and
+        the last good value is returned instead. Authentication errors are
+        raised, as no other request will succeed either.
+        """
+
+        try:
+            value = await self._async_request(request, *args)
+        except WhistleAuthError:
+            raise
+        except Exception as error:
+            self._section_failed(pet_ids, section, error)
+            return fallback
+        if not SECTION_VALIDATORS[section](value):
+            self._section_failed(pet_ids, section, "unexpected response")
+            return fallback
+        for pet_id in pet_ids:
+            failures = self.section_failures.get(pet_id, {})
+            if failures.pop(section, None) is not None:
+                LOGGER.info(f'Whistle {section} of pet {pet_id} updated again')
+        return value
+
+    def _section_failed(self, pet_ids: list[str], section: str, error: Exception | str) -> None:
+        """ Record when a section of pets started failing. """
+
+        now = dt_util.utcnow()
+        for pet_id in pet_ids:
+            failures = self.section_failures.setdefault(pet_id, {})
+            if section not in failures:
+                LOGGER.warning(f'Failed to update Whistle {section} of pet {pet_id}, keeping last known data: {error}')
+                failures[section] = now
+
+    def _section_failing(self, pet_id: str, sections: frozenset[str]) -> bool:
+        """ Return True if any of the given sections of a pet failed to update. """
+
+        return not self.section_failures.get(pet_id, {}).keys().isdisjoint(sections)
+
+    def stale_since(self, pet_id: str, sections: frozenset[str]) -> datetime | None:
+        """ Return when the first of the given sections of a pet that is failing started to fail, or None. """
+
+        failures = self.section_failures.get(pet_id, {})
+        return min((failures[section] for section in sections if section in failures), default=None)
+
+    def sections_expired(self, pet_id: str, sections: frozenset[str]) -> bool:
+        """ Return True if any of the given sections of a pet failed for longer than data may be stale. """
+
+        stale_since = self.stale_since(pet_id, sections)
+        return stale_since is not None and (
+            dt_util.utcnow() - stale_since > timedelta(seconds=STALE_DATA_MAX_AGE)
+        )
+
+    @staticmethod
+    async def _async_previous(*values: Any) -> tuple[Any, ...]:
+        """ Return already known values in place of a fetch that is not due. """
+
+        return values
+
+    @staticmethod
+    def _merge_pet(pet: dict[str, Any], previous: Pet) -> Pet:
+        """ Combine a fresh pets entry with the last known data of a pet. """
+
+        return Pet(
+            id=previous.id,
+            data=pet,
+            device=previous.device,
+            dailies=previous.dailies,
+            events=previous.events,
+            places=previous.places,
+            stats=previous.stats,
+            health=previous.health,
+        )
+
+    async def _async_request(self, request: Callable[..., Awaitable[_T]], *args: Any) -> _T:
+        """Make a single Whistle API request, bounded by the request
+        semaphore and the request budget shared by all entries. The
+        latency is added to the metrics of the refresh.
+        """
+
+        async with self._semaphore:
+            await self._scheduler.budget.async_acquire()
+            start = time.perf_counter()
+            try:
+                return await request(*args)
+            finally:
+                if metrics := self.metrics.latest:
+                    metrics.add_request(request.__name__, (time.perf_counter() - start) * 1000)
@@ -1,24 +1,25 @@
 """ Device Tracker platform for Whistle integration."""
 from __future__ import annotations
 
-from typing import Any
-
-from whistleaio.model import Pet
-
 from homeassistant.components.device_tracker.const import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_NOT_HOME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_ZONE_METHOD,
     DEFAULT_ZONE_METHOD,
     DOMAIN,
+    SECTION_DEVICE,
+    SECTION_LAST_LOCATION,
+    SECTION_PLACES,
     WHISTLE_COORDINATOR,
+    ZONE_METHOD_LOCAL,
 )
 from .coordinator import WhistleDataUpdateCoordinator
+from .entity import WhistleEntity
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -30,22 +31,27 @@ async def async_setup_entry(
     device_trackers = []
 
 
-    for pet_id, pet_data in coordinator.data.pets.items():
+    for pet_id, pet in coordinator.snapshots.items():
 
             """ Device Trackers """
-            if pet_data.data['device'] and pet_data.data['device']['has_gps']:
+            if pet.has_gps:
                 device_trackers.extend((
                         WhistleTracker(coordinator, pet_id, entry),
                     ))
     async_add_entities(device_trackers)
 
-class WhistleTracker(CoordinatorEntity, TrackerEntity):
+class WhistleTracker(WhistleEntity, TrackerEntity):
     """ Representation of Whistle GPS Tracker. """
 
+    _attr_name = "Whistle tracker"
+    _sections = frozenset({SECTION_DEVICE, SECTION_LAST_LOCATION, SECTION_PLACES})
+
     def __init__(self, coordinator, pet_id, entry):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
+        super().__init__(coordinator, pet_id)
         self.entry = entry
+        self._attr_unique_id = f'{pet_id}_tracker'
+        self._local_zone: str | None = None
+        self._update_attrs()
 
     @property
     def zone_method(self):
@@ -53,62 +59,23 @@ class WhistleTracker(CoordinatorEntity, TrackerEntity):
         
         return self.entry.options[CONF_ZONE_METHOD]
 
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def location_dict(self) -> dict[int, str]:
-        """ Create a dictionary for all pre-defined Whistle
-        locations as a dict of location id: location name.
-        """
-
-        locations: dict[int, str] = {}
-        for place in self.pet_data.places:
-            locations[place['id']] = place['name']
-
-        return locations
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_tracker'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Whistle tracker"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
+    def _update_attrs(self) -> None:
+        """ Match the latest location against local geofences if that zone method is used. """
 
-        return True
+        location = self.pet.location
+        if self.zone_method == ZONE_METHOD_LOCAL and location:
+            self._local_zone = self.coordinator.async_match_geofence(
+                self.pet_id,
+                location.latitude,
+                location.longitude,
+                location.accuracy,
+            )
 
     @property
     def icon(self):
         """ Determine what icon to use. """
 
-        if self.pet_data.data['profile']['species'] == 'dog':
-            return 'mdi:dog'
-        if self.pet_data.data['profile']['species'] == 'cat':
-            return 'mdi:cat'
+        return self.pet.icon
 
     @property
     def source_type(self) -> SourceType:
@@ -117,28 +84,28 @@ class WhistleTracker(CoordinatorEntity, TrackerEntity):
         return SourceType.GPS
 
     @property
-    def latitude(self) -> float:
+    def latitude(self) -> float | None:
         """ Return most recent latitude. """
 
-        return self.pet_data.data['last_location']['latitude']
+        return self.pet.location.latitude if self.pet.location else None
 
     @property
-    def longitude(self) -> float:
+    def longitude(self) -> float | None:
         """ Return most recent longitude. """
 
-        return self.pet_data.data['last_location']['longitude']
+        return self.pet.location.longitude if self.pet.location else None
 
     @property
-    def battery_level(self) -> int:
+    def battery_level(self) -> int | None:
         """ Return tracker current battery percent. """
 
-        return self.pet_data.data['device']['battery_level']
+        return self.pet.battery_level
 
     @property
     def location_accuracy(self) -> int:
         """ Return last location gps accuracy. """
 
-        return int(self.pet_data.data['last_location']['uncertainty_meters'])
+        return self.pet.location.accuracy if self.pet.location else 0
 
     @property
     def location_name(self) -> str | None:
@@ -146,16 +113,20 @@ class WhistleTracker(CoordinatorEntity, TrackerEntity):
         if zone method is set to Whistle.If the tracker is not in
         a pre-defined location, location of Away is returned.
         If zone method is set to Home Assistant, Home Assistant
-        zones will be used instead.
+        zones will be used instead. If zone method is set to Local,
+        the location is matched against both Whistle places and Home
+        Assistant zones by the integration.
         """
         
         if self.zone_method == DEFAULT_ZONE_METHOD:
-            if self.pet_data.data['last_location']['place']['status'] == 'outside_geofence_range':
+            location = self.pet.location
+            if location is None or location.place_status == 'outside_geofence_range':
                 return "Away"
-            elif self.pet_data.data['last_location']['place']['id']:
-                location_id = self.pet_data.data['last_location']['place']['id']
-                return self.location_dict.get(location_id)
+            elif location.place_id:
+                return self.coordinator.place_names[self.pet_id].get(location.place_id)
             else:
                 return "Away"
+        elif self.zone_method == ZONE_METHOD_LOCAL:
+            return self._local_zone or STATE_NOT_HOME
         else:
             return None
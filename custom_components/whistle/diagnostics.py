@@ -0,0 +1,36 @@
+""" Diagnostics for Whistle integration. """
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_TOKEN
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, WHISTLE_COORDINATOR
+from .coordinator import WhistleDataUpdateCoordinator
+
+TO_REDACT = {CONF_EMAIL, CONF_PASSWORD, CONF_TOKEN, 'unique_id'}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """ Return diagnostics of a Whistle config entry, including refresh metrics. """
+
+    coordinator: WhistleDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][WHISTLE_COORDINATOR]
+
+    return {
+        'entry': async_redact_data(entry.as_dict(), TO_REDACT),
+        'coordinator': {
+            'last_update_success': coordinator.last_update_success,
+            'update_interval': coordinator.update_interval.total_seconds(),
+            'pets': len(coordinator.data.pets) if coordinator.data else 0,
+            'section_failures': {
+                pet_id: {section: since.isoformat() for section, since in failures.items()}
+                for pet_id, failures in coordinator.section_failures.items()
+            },
+        },
+        'metrics': coordinator.metrics.as_dict(),
+    }
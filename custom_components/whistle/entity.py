@@ -0,0 +1,103 @@
+""" Base entity for Whistle integration. """
+from __future__ import annotations
+
+from typing import Any
+
+from whistleaio.model import Pet
+
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import ATTR_STALE, ATTR_STALE_SINCE, DOMAIN
+from .coordinator import WhistleDataUpdateCoordinator
+from .model import PetSnapshot
+
+
+class WhistleEntity(CoordinatorEntity[WhistleDataUpdateCoordinator]):
+    """Base Whistle pet entity. State is only written when one of
+    the data sections listed in _sections changed during the last
+    coordinator refresh, or when availability or staleness changed.
+    Sections that fail to update keep their last known value and only
+    make the entities depending on them stale, then unavailable.
+    """
+
+    _attr_has_entity_name = True
+    _sections: frozenset[str] = frozenset()
+
+    def __init__(self, coordinator: WhistleDataUpdateCoordinator, pet_id: str) -> None:
+        super().__init__(coordinator)
+        self.pet_id = pet_id
+        self._last_status = self._status()
+        pet = self.pet
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, pet.pet_id)},
+            name=pet.name,
+            manufacturer="Whistle",
+            model=pet.model_id,
+            configuration_url="https://www.whistle.com/",
+        )
+
+    @property
+    def pet_data(self) -> Pet:
+        """ Handle coordinator pet data. """
+
+        return self.coordinator.data.pets[self.pet_id]
+
+    @property
+    def pet(self) -> PetSnapshot:
+        """ Return the normalized snapshot of the pet from the latest refresh. """
+
+        return self.coordinator.snapshots[self.pet_id]
+
+    @property
+    def available(self) -> bool:
+        """ Return False once a section this entity depends on failed to update for too long. """
+
+        return super().available and not self.coordinator.sections_expired(self.pet_id, self._sections)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Mark last known values as stale while Whistle is unreachable or
+        a section this entity depends on fails to update.
+        """
+
+        attributes = super().extra_state_attributes
+        stale_since = self.coordinator.stale_since(self.pet_id, self._sections)
+        if not self.coordinator.stale and stale_since is None:
+            return attributes
+        attributes = {**(attributes or {}), ATTR_STALE: True}
+        if stale_since is not None:
+            attributes[ATTR_STALE_SINCE] = stale_since.isoformat()
+        return attributes
+
+    def _update_attrs(self) -> None:
+        """ Cache values derived from pet data. Called when a subscribed section changes. """
+
+    def _status(self) -> tuple[Any, ...]:
+        """Return what availability and staleness of this entity depend
+        on, apart from the data of its sections.
+        """
+
+        return (
+            self.coordinator.last_update_success,
+            self.coordinator.stale,
+            self.coordinator.stale_since(self.pet_id, self._sections),
+            self.coordinator.sections_expired(self.pet_id, self._sections),
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached values and write state only if data this entity
+        depends on changed, or its availability or staleness changed.
+        """
+
+        sections_changed = self.coordinator.sections_changed(self.pet_id, self._sections)
+        if sections_changed:
+            self._update_attrs()
+        status = self._status()
+        write_state = sections_changed or status != self._last_status
+        self.coordinator.metrics.entity_notified(write_state)
+        if write_state:
+            self._last_status = status
+            self.async_write_ha_state()
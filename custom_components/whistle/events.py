@@ -0,0 +1,45 @@
+""" Per-pet log of recent Whistle events for Whistle integration. """
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from typing import Any
+
+
+def event_key(item: dict[str, Any]) -> Any:
+    """ Identify an event. Daily items have no id, so type and start time are used if needed. """
+
+    if item.get('id') is not None:
+        return item['id']
+    return item.get('type'), item.get('title'), item.get('start_time')
+
+
+class PetEventLog:
+    """Bounded log of the most recent events of a pet, oldest first.
+    Events already in the log are recognized, so only events that were
+    not seen before are reported as new. An event that was still running
+    when it was added is reported once more when it first has an end time.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.events: deque[dict[str, Any]] = deque(maxlen=size)
+        self._keys: deque[Any] = deque(maxlen=size)
+
+    def add(self, items: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Add daily items, which Whistle lists newest first. Returns the
+        items that were not in the log or just finished, oldest first.
+        """
+
+        new: list[dict[str, Any]] = []
+        for item in reversed(list(items)):
+            key = event_key(item)
+            if key in self._keys:
+                index = self._keys.index(key)
+                if self.events[index].get('end_time') is None and item.get('end_time') is not None:
+                    self.events[index] = item
+                    new.append(item)
+                continue
+            self._keys.append(key)
+            self.events.append(item)
+            new.append(item)
+        return new
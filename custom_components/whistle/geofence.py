@@ -0,0 +1,104 @@
+""" Local geofence matching for Whistle integration. """
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+import math
+
+EARTH_RADIUS_METERS = 6371008.8
+METERS_PER_DEGREE = 111320.0
+
+
+@dataclass(frozen=True, slots=True)
+class Geofence:
+    """ Circular area, either a Whistle place or a Home Assistant zone. """
+
+    key: str
+    name: str
+    latitude: float
+    longitude: float
+    radius: float
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """ Return the great-circle distance in meters between two coordinates. """
+
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(a))
+
+
+class GeofenceIndex:
+    """Grid bucketed spatial index of geofences. Each geofence is stored
+    in every grid cell its bounding box overlaps, so a lookup only measures
+    the distance to geofences near the location instead of all of them.
+    """
+
+    def __init__(self, geofences: Iterable[Geofence], cell_degrees: float) -> None:
+        self._cell_degrees = cell_degrees
+        self._cells: dict[tuple[int, int], list[Geofence]] = defaultdict(list)
+        for geofence in geofences:
+            for cell in self._cells_around(geofence.latitude, geofence.longitude, geofence.radius):
+                self._cells[cell].append(geofence)
+
+    def _cells_around(self, latitude: float, longitude: float, meters: float) -> Iterator[tuple[int, int]]:
+        """ Return the grid cells overlapping a bounding box of meters around a location. """
+
+        d_lat = meters / METERS_PER_DEGREE
+        d_lon = meters / (METERS_PER_DEGREE * max(math.cos(math.radians(latitude)), 0.01))
+        size = self._cell_degrees
+        for row in range(math.floor((latitude - d_lat) / size), math.floor((latitude + d_lat) / size) + 1):
+            for col in range(math.floor((longitude - d_lon) / size), math.floor((longitude + d_lon) / size) + 1):
+                yield row, col
+
+    def candidates(self, latitude: float, longitude: float, margin: float) -> set[Geofence]:
+        """ Return geofences that could contain a location with the given margin in meters. """
+
+        found: set[Geofence] = set()
+        for cell in self._cells_around(latitude, longitude, margin):
+            found.update(self._cells.get(cell, ()))
+        return found
+
+
+class GeofenceEngine:
+    """Match pet locations against a GeofenceIndex. The geofence a pet
+    is in is remembered, and the pet is only considered to have left it
+    once it is more than the hysteresis distance outside of it.
+    """
+
+    def __init__(self, cell_degrees: float, hysteresis: float) -> None:
+        self._cell_degrees = cell_degrees
+        self._hysteresis = hysteresis
+        self._index = GeofenceIndex((), cell_degrees)
+        self._current: dict[str, Geofence] = {}
+
+    def rebuild(self, geofences: Iterable[Geofence]) -> None:
+        """ Replace the indexed geofences. """
+
+        self._index = GeofenceIndex(geofences, self._cell_degrees)
+
+    def match(self, pet_id: str, latitude: float, longitude: float, accuracy: float) -> Geofence | None:
+        """Return the geofence a pet is in. A geofence is entered if the
+        location, allowing for its accuracy, is within the radius. If
+        several geofences match, the closest one wins.
+        """
+
+        current = self._current.get(pet_id)
+        best: Geofence | None = None
+        best_distance = math.inf
+        for geofence in self._index.candidates(latitude, longitude, accuracy + self._hysteresis):
+            distance = haversine(latitude, longitude, geofence.latitude, geofence.longitude)
+            if geofence == current and distance - accuracy <= geofence.radius + self._hysteresis:
+                return current
+            if distance - accuracy <= geofence.radius and distance < best_distance:
+                best, best_distance = geofence, distance
+
+        if best is None:
+            self._current.pop(pet_id, None)
+        else:
+            self._current[pet_id] = best
+        return best
@@ -0,0 +1,350 @@
+""" Long-term activity and health history for Whistle integration. """
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator
+from datetime import date, timedelta
+import json
+import math
+import os
+import shutil
+import sys
+from typing import Any
+
+from whistleaio.model import Pet, WhistleData
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import (
+    DOMAIN,
+    HISTORY_SAVE_DELAY,
+    LOGGER,
+    PERIOD_DAY,
+    PERIOD_MONTH,
+    PERIOD_WEEK,
+    SECTION_DAILIES,
+    SECTION_HEALTH,
+)
+
+EPOCH = date(1970, 1, 1)
+FILE_VERSION = 1
+
+""" Daily activity totals, summed in rollups. """
+ACTIVITY_COLUMNS = ('distance', 'calories', 'minutes_active', 'minutes_rest')
+
+""" Health trend metrics as (trend, metric index), averaged in rollups. """
+HEALTH_COLUMNS: dict[str, tuple[str, int]] = {
+    'scratching': ('scratching', 0),
+    'licking': ('licking', 0),
+    'drinking': ('drinking', 0),
+    'sleeping': ('sleeping', 0),
+    'sleep_disruptions': ('sleeping', 1),
+    'eating': ('eating', 0),
+    'wellness_index': ('wellness_index', 0),
+}
+
+COLUMNS = ACTIVITY_COLUMNS + tuple(HEALTH_COLUMNS)
+
+
+def day_to_date(day: int) -> date:
+    """ Convert a Whistle day number, the number of days since 1970-01-01, to a date. """
+
+    return EPOCH + timedelta(days=day)
+
+
+def date_to_day(value: date) -> int:
+    """ Convert a date to a Whistle day number. """
+
+    return (value - EPOCH).days
+
+
+class PetHistory:
+    """Daily history of a single pet, stored column by column in arrays
+    sorted by day number. Values that are unknown are stored as NaN.
+    Days are 32-bit integers and values 32-bit floats, so a year of
+    history takes about 17 KiB.
+    """
+
+    def __init__(self) -> None:
+        self.days = array('i')
+        self.columns: dict[str, array] = {column: array('f') for column in COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def upsert(self, day: int, values: dict[str, float | None]) -> bool:
+        """Store the values of a day, keeping values of other columns of
+        that day. Returns True if anything changed.
+        """
+
+        index = bisect_left(self.days, day)
+        if index == len(self.days) or self.days[index] != day:
+            self.days.insert(index, day)
+            for column in self.columns.values():
+                column.insert(index, math.nan)
+
+        changed = False
+        for name, value in values.items():
+            if value is None:
+                continue
+            column = self.columns[name]
+            # Compare as stored, since values are rounded to 32-bit floats.
+            stored = array('f', [value])[0]
+            if column[index] != stored:
+                column[index] = stored
+                changed = True
+        return changed
+
+    def rows(self, start: int, end: int) -> Iterator[tuple[int, dict[str, float | None]]]:
+        """ Yield the day number and values of every stored day from start to end, inclusive. """
+
+        for index in range(bisect_left(self.days, start), bisect_right(self.days, end)):
+            yield self.days[index], {
+                name: None if math.isnan(column[index]) else column[index]
+                for name, column in self.columns.items()
+            }
+
+    def query(self, start: int, end: int, period: str = PERIOD_DAY) -> list[dict[str, Any]]:
+        """Return the history from start to end, inclusive, per day or
+        rolled up per week or month. Activity totals are summed and
+        health metrics averaged over the days they are known.
+        """
+
+        if period == PERIOD_DAY:
+            return [
+                {'date': day_to_date(day).isoformat(), **{name: _round(value) for name, value in values.items()}}
+                for day, values in self.rows(start, end)
+            ]
+
+        period_start: Callable[[date], date]
+        if period == PERIOD_WEEK:
+            period_start = _week_start
+        elif period == PERIOD_MONTH:
+            period_start = _month_start
+        else:
+            raise ValueError(f'Unknown history period: {period}')
+        buckets: dict[date, list[dict[str, float | None]]] = {}
+        for day, values in self.rows(start, end):
+            buckets.setdefault(period_start(day_to_date(day)), []).append(values)
+
+        rollups: list[dict[str, Any]] = []
+        for bucket_start, bucket in buckets.items():
+            rollup: dict[str, Any] = {'date': bucket_start.isoformat(), 'days': len(bucket)}
+            for name in COLUMNS:
+                known = [values[name] for values in bucket if values[name] is not None]
+                if not known:
+                    rollup[name] = None
+                elif name in ACTIVITY_COLUMNS:
+                    rollup[name] = _round(sum(known))
+                else:
+                    rollup[name] = _round(sum(known) / len(known))
+            rollups.append(rollup)
+        return rollups
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a JSON header line followed by the raw day array
+        and the raw array of every column.
+        """
+
+        header = json.dumps({
+            'version': FILE_VERSION,
+            'byteorder': sys.byteorder,
+            'rows': len(self.days),
+            'columns': list(self.columns),
+        })
+        return b''.join(
+            [header.encode() + b'\n', self.days.tobytes()]
+            + [column.tobytes() for column in self.columns.values()]
+        )
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> PetHistory:
+        """ Deserialize history created by to_bytes. Columns missing in the file are filled with NaN. """
+
+        header_line, _, body = raw.partition(b'\n')
+        header = json.loads(header_line)
+        rows: int = header['rows']
+        history = cls()
+
+        history.days.frombytes(body[:rows * history.days.itemsize])
+        offset = rows * history.days.itemsize
+        stored: dict[str, array] = {}
+        for name in header['columns']:
+            column = array('f')
+            column.frombytes(body[offset:offset + rows * column.itemsize])
+            offset += rows * column.itemsize
+            stored[name] = column
+        if header['byteorder'] != sys.byteorder:
+            history.days.byteswap()
+            for column in stored.values():
+                column.byteswap()
+
+        for name in COLUMNS:
+            history.columns[name] = stored.get(name, array('f', [math.nan]) * rows)
+        return history
+
+
+def _week_start(value: date) -> date:
+    """ Return the Monday of the week of a date. """
+
+    return value - timedelta(days=value.weekday())
+
+
+def _month_start(value: date) -> date:
+    """ Return the first day of the month of a date. """
+
+    return value.replace(day=1)
+
+
+def _round(value: float | None) -> float | None:
+    """ Round a value read from a 32-bit float column to a sensible precision. """
+
+    return None if value is None else round(value, 2)
+
+
+def _daily_values(daily: dict[str, Any]) -> dict[str, float | None]:
+    """ Return the activity columns of a dailies entry. """
+
+    return {column: daily.get(column) for column in ACTIVITY_COLUMNS}
+
+
+def _health_values(health: dict[str, Any]) -> dict[str, float | None]:
+    """ Return the health columns of the current health trends. """
+
+    values: dict[str, float | None] = {}
+    for column, (trend, metric) in HEALTH_COLUMNS.items():
+        try:
+            values[column] = float(health[trend]['metrics'][metric]['value'])
+        except (KeyError, IndexError, TypeError, ValueError):
+            values[column] = None
+    return values
+
+
+class HistoryStore:
+    """History of every pet of a config entry. Each pet is saved to its
+    own file in .storage, shortly after its history changed.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self.hass = hass
+        self.path = history_path(hass, entry_id)
+        self.pets: dict[str, PetHistory] = {}
+        self.changed_days: dict[str, int] = {}
+        self._dirty: set[str] = set()
+        self._cancel_save: CALLBACK_TYPE | None = None
+
+    async def async_load(self) -> None:
+        """ Load the history of every pet from disk. """
+
+        self.pets = await self.hass.async_add_executor_job(self._load)
+
+    def _load(self) -> dict[str, PetHistory]:
+        """ Read all pet history files. Runs in the executor. """
+
+        pets: dict[str, PetHistory] = {}
+        if not os.path.isdir(self.path):
+            return pets
+        for file_name in os.listdir(self.path):
+            pet_id, extension = os.path.splitext(file_name)
+            if extension != '.bin':
+                continue
+            try:
+                with open(os.path.join(self.path, file_name), 'rb') as file:
+                    pets[pet_id] = PetHistory.from_bytes(file.read())
+            except (OSError, ValueError, KeyError) as error:
+                LOGGER.warning(f'Ignoring unreadable Whistle history of pet {pet_id}: {error}')
+        return pets
+
+    @callback
+    def async_update(self, data: WhistleData, changed_sections: dict[str, frozenset[str]]) -> set[str]:
+        """Append the dailies and current health metrics of every pet
+        whose dailies or health changed. All dailies Whistle returns are
+        stored, which backfills the history of a pet the first time it
+        is seen. Returns the ids of pets whose history changed.
+        """
+
+        changed: set[str] = set()
+        for pet_id, pet in data.pets.items():
+            sections = changed_sections.get(pet_id, frozenset())
+            if pet_id in self.pets and SECTION_DAILIES not in sections and SECTION_HEALTH not in sections:
+                continue
+            if self._update_pet(pet_id, pet):
+                changed.add(pet_id)
+        if changed:
+            self._dirty |= changed
+            self._schedule_save()
+        return changed
+
+    def _update_pet(self, pet_id: str, pet: Pet) -> bool:
+        """Store the dailies and health metrics of a single pet. The
+        first day with changed activity is kept in changed_days.
+        """
+
+        dailies = (pet.dailies or {}).get('dailies') or []
+        if not dailies:
+            return False
+        history = self.pets.setdefault(pet_id, PetHistory())
+        changed = False
+        for daily in dailies:
+            day = daily.get('day_number')
+            if day is None or daily.get('excluded'):
+                continue
+            if history.upsert(day, _daily_values(daily)):
+                changed = True
+                self.changed_days[pet_id] = min(self.changed_days.get(pet_id, day), day)
+        if pet.health:
+            changed |= history.upsert(dailies[0]['day_number'], _health_values(pet.health))
+        return changed
+
+    @callback
+    def _schedule_save(self) -> None:
+        """ Save changed history after a delay, so consecutive refreshes are written together. """
+
+        if self._cancel_save is None:
+            self._cancel_save = async_call_later(self.hass, HISTORY_SAVE_DELAY, self._async_scheduled_save)
+
+    async def _async_scheduled_save(self, _now: Any) -> None:
+        """ Save changed history when the save delay passed. """
+
+        self._cancel_save = None
+        await self.async_save()
+
+    async def async_save(self) -> None:
+        """ Write the history of every changed pet to disk now. """
+
+        if self._cancel_save:
+            self._cancel_save()
+            self._cancel_save = None
+        if not self._dirty:
+            return
+        pets = {pet_id: self.pets[pet_id].to_bytes() for pet_id in self._dirty}
+        self._dirty = set()
+        try:
+            await self.hass.async_add_executor_job(self._save, pets)
+        except OSError as error:
+            LOGGER.warning(f'Failed to save Whistle history: {error}')
+
+    def _save(self, pets: dict[str, bytes]) -> None:
+        """ Atomically replace the history files of pets. Runs in the executor. """
+
+        os.makedirs(self.path, exist_ok=True)
+        for pet_id, raw in pets.items():
+            path = os.path.join(self.path, f'{pet_id}.bin')
+            with open(f'{path}.tmp', 'wb') as file:
+                file.write(raw)
+            os.replace(f'{path}.tmp', path)
+
+
+def history_path(hass: HomeAssistant, entry_id: str) -> str:
+    """ Return the directory holding the history of a config entry. """
+
+    return hass.config.path(STORAGE_DIR, f'{DOMAIN}.history.{entry_id}')
+
+
+def remove_history(path: str) -> None:
+    """ Delete the history of a config entry. Runs in the executor. """
+
+    shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,156 @@
+""" Refresh metrics for Whistle integration. """
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+import statistics
+from typing import Any
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """ Latency of the requests made to a single Whistle endpoint during a refresh. """
+
+    requests: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def add(self, duration_ms: float) -> None:
+        """ Add the latency of a single request. """
+
+        self.requests += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+
+@dataclass(slots=True)
+class RefreshMetrics:
+    """ Measurements of a single coordinator refresh. """
+
+    started: datetime
+    duration_ms: float = 0.0
+    success: bool = True
+    stale: bool = False
+    error: str | None = None
+    bytes_received: int = 0
+    pets: int = 0
+    entities_notified: int = 0
+    state_writes: int = 0
+    endpoints: dict[str, EndpointMetrics] = field(default_factory=dict)
+
+    def add_request(self, endpoint: str, duration_ms: float) -> None:
+        """ Add the latency of a request to an endpoint. """
+
+        if endpoint not in self.endpoints:
+            self.endpoints[endpoint] = EndpointMetrics()
+        self.endpoints[endpoint].add(duration_ms)
+
+
+class RefreshMetricsBuffer:
+    """Fixed size ring buffer of the metrics of the most recent
+    refreshes. Failures are also counted over the lifetime of the
+    coordinator, as they would otherwise age out of the buffer. Location
+    polls between refreshes have their own lifetime counters, so they
+    don't inflate the metrics of the refresh before them.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._refreshes: deque[RefreshMetrics] = deque(maxlen=size)
+        self.refreshes = 0
+        self.failures = 0
+        self.location_polls = 0
+        self.location_poll_entities_notified = 0
+        self.location_poll_state_writes = 0
+        self._polling_locations = False
+
+    @property
+    def latest(self) -> RefreshMetrics | None:
+        """ Return the metrics of the most recent refresh. """
+
+        return self._refreshes[-1] if self._refreshes else None
+
+    def start(self, started: datetime) -> RefreshMetrics:
+        """ Add and return the metrics of a refresh that is starting. """
+
+        metrics = RefreshMetrics(started=started)
+        self._refreshes.append(metrics)
+        self.refreshes += 1
+        return metrics
+
+    def failed(self, metrics: RefreshMetrics, error: Exception) -> None:
+        """ Mark a refresh as failed. """
+
+        metrics.success = False
+        metrics.error = str(error) or type(error).__name__
+        self.failures += 1
+
+    @contextmanager
+    def location_poll(self) -> Iterator[None]:
+        """ Count entities notified within the block as part of a location poll. """
+
+        self.location_polls += 1
+        self._polling_locations = True
+        try:
+            yield
+        finally:
+            self._polling_locations = False
+
+    def entity_notified(self, state_written: bool) -> None:
+        """Count an entity notified of the latest refresh or location poll
+        and whether it wrote its state.
+        """
+
+        if self._polling_locations:
+            self.location_poll_entities_notified += 1
+            if state_written:
+                self.location_poll_state_writes += 1
+            return
+        if (metrics := self.latest) is None:
+            return
+        metrics.entities_notified += 1
+        if state_written:
+            metrics.state_writes += 1
+
+    def summary(self) -> dict[str, Any]:
+        """ Summarize the buffered refreshes. """
+
+        durations = [metrics.duration_ms for metrics in self._refreshes if metrics.success]
+        endpoints: dict[str, EndpointMetrics] = {}
+        for metrics in self._refreshes:
+            for endpoint, endpoint_metrics in metrics.endpoints.items():
+                combined = endpoints.setdefault(endpoint, EndpointMetrics())
+                combined.requests += endpoint_metrics.requests
+                combined.total_ms += endpoint_metrics.total_ms
+                combined.max_ms = max(combined.max_ms, endpoint_metrics.max_ms)
+        return {
+            'refreshes': self.refreshes,
+            'failures': self.failures,
+            'buffered_refreshes': len(self._refreshes),
+            'location_polls': self.location_polls,
+            'location_poll_entities_notified': self.location_poll_entities_notified,
+            'location_poll_state_writes': self.location_poll_state_writes,
+            'median_duration_ms': round(statistics.median(durations), 1) if durations else None,
+            'max_duration_ms': round(max(durations), 1) if durations else None,
+            'mean_bytes_received': round(
+                statistics.mean(metrics.bytes_received for metrics in self._refreshes)
+            ) if self._refreshes else None,
+            'endpoint_mean_ms': {
+                endpoint: round(combined.total_ms / combined.requests, 1)
+                for endpoint, combined in sorted(endpoints.items())
+            },
+            'endpoint_max_ms': {
+                endpoint: round(combined.max_ms, 1)
+                for endpoint, combined in sorted(endpoints.items())
+            },
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """ Return the summary and every buffered refresh. """
+
+        return {
+            'summary': self.summary(),
+            'refreshes': [asdict(metrics) for metrics in self._refreshes],
+        }
@@ -0,0 +1,194 @@
+""" Normalized pet snapshots for Whistle integration. """
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from whistleaio.model import Pet
+
+from .util import parse_local_timestamp, parse_timestamp
+
+""" Icon of a pet per species. """
+SPECIES_ICONS = {'dog': 'mdi:dog', 'cat': 'mdi:cat'}
+
+
+@dataclass(frozen=True, slots=True)
+class EventSnapshot:
+    """ Most recent event of today. """
+
+    title: str | None
+    start: datetime | None
+    end: datetime | None
+    distance: float
+    calories: float
+    duration: float
+
+
+@dataclass(frozen=True, slots=True)
+class HealthTrendSnapshot:
+    """ Status and metric values of a health trend. """
+
+    status: str | None
+    values: tuple[Any, ...]
+
+    def value(self, index: int) -> Any:
+        """ Return a metric value, or None if Whistle did not provide it. """
+
+        return self.values[index] if index < len(self.values) else None
+
+
+@dataclass(frozen=True, slots=True)
+class LocationSnapshot:
+    """ Last known location of a pet. """
+
+    latitude: float
+    longitude: float
+    accuracy: int
+    place_id: int | None
+    place_status: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class PetSnapshot:
+    """Typed view of the data of a pet, built by the coordinator once per
+    refresh in which the pet changed. Fields Whistle did not provide are
+    None, so entities never index into the raw payload.
+    """
+
+    pet_id: str
+    name: str | None
+    species: str | None
+    icon: str | None
+    model_id: str | None
+    has_device: bool
+    has_gps: bool
+    battery_level: float | None
+    battery_days_left: float | None
+    wifi_usage: int | None
+    cellular_usage: int | None
+    last_check_in: datetime | None
+    minutes_active: int | None
+    minutes_rest: int | None
+    activity_streak: int | None
+    activity_goal: int | None
+    distance: float | None
+    calories: int | None
+    location: LocationSnapshot | None
+    event: EventSnapshot | None
+    health: dict[str, HealthTrendSnapshot] = field(default_factory=dict)
+
+    @classmethod
+    def from_pet(cls, pet: Pet) -> PetSnapshot:
+        """ Build a snapshot from the raw data of a pet, tolerating missing fields. """
+
+        data = pet.data or {}
+        device = data.get('device') or {}
+        battery_stats = _path(pet.device, 'device', 'battery_stats') or {}
+        usage = _path(battery_stats, 'prior_usage_minutes', '24h') or {}
+        summary = data.get('activity_summary') or {}
+        today = _path(pet.dailies, 'dailies', 0) or {}
+        species = _path(data, 'profile', 'species')
+        calories = today.get('calories')
+        return cls(
+            pet_id=pet.id,
+            name=data.get('name'),
+            species=species,
+            icon=SPECIES_ICONS.get(species),
+            model_id=device.get('model_id'),
+            has_device=bool(device),
+            has_gps=bool(device.get('has_gps')),
+            battery_level=device.get('battery_level'),
+            battery_days_left=battery_stats.get('battery_days_left'),
+            wifi_usage=_usage_percent(usage.get('power_save_mode')),
+            cellular_usage=_usage_percent(usage.get('cellular')),
+            last_check_in=_check_in(device.get('last_check_in'), _path(data, 'profile', 'time_zone_name')),
+            minutes_active=summary.get('current_minutes_active'),
+            minutes_rest=summary.get('current_minutes_rest'),
+            activity_streak=summary.get('current_streak'),
+            activity_goal=_path(summary, 'current_activity_goal', 'minutes'),
+            distance=today.get('distance'),
+            calories=None if calories is None else int(calories),
+            location=_location(data.get('last_location')),
+            event=_event(_path(pet.events, 'daily_items', 0)),
+            health={
+                trend_key: HealthTrendSnapshot(
+                    status=trend['status'].replace('_', ' ').capitalize() if trend.get('status') else None,
+                    values=tuple(metric.get('value') for metric in trend.get('metrics') or ()),
+                )
+                for trend_key, trend in (pet.health or {}).items()
+                if isinstance(trend, dict) and trend
+            },
+        )
+
+
+def _path(value: Any, *keys: str | int) -> Any:
+    """ Follow keys and list indexes into nested data. Returns None if any step is missing. """
+
+    for key in keys:
+        try:
+            value = value[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return value
+
+
+def _usage_percent(minutes: Any) -> int | None:
+    """ Convert minutes of the last 24 hours to a percentage. """
+
+    if minutes is None:
+        return None
+    return int(round(((float(minutes) / 1440) * 100), 0))
+
+
+def _check_in(value: str | None, zone: str | None) -> datetime | None:
+    """ Parse the last check-in of a device in the time zone of the pet. """
+
+    if not value or not zone:
+        return None
+    try:
+        return parse_local_timestamp(value, zone)
+    except (ValueError, KeyError):
+        return None
+
+
+def _timestamp(value: str | None) -> datetime | None:
+    """ Parse an event timestamp. """
+
+    if not value:
+        return None
+    try:
+        return parse_timestamp(value)
+    except ValueError:
+        return None
+
+
+def _location(location: dict[str, Any] | None) -> LocationSnapshot | None:
+    """ Convert the last location of a pet, if it has coordinates. """
+
+    if not location or location.get('latitude') is None or location.get('longitude') is None:
+        return None
+    place = location.get('place') or {}
+    return LocationSnapshot(
+        latitude=location['latitude'],
+        longitude=location['longitude'],
+        accuracy=int(location.get('uncertainty_meters') or 0),
+        place_id=place.get('id'),
+        place_status=place.get('status'),
+    )
+
+
+def _event(item: dict[str, Any] | None) -> EventSnapshot | None:
+    """ Convert the most recent daily item of a pet. """
+
+    if not item:
+        return None
+    data = item.get('data') or {}
+    return EventSnapshot(
+        title=item.get('title'),
+        start=_timestamp(item.get('start_time')),
+        end=_timestamp(item.get('end_time')),
+        distance=data.get('distance', 0.0),
+        calories=data.get('calories', 0),
+        duration=data.get('duration', 0.0),
+    )
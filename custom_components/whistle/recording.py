@@ -0,0 +1,135 @@
+""" Record and replay Whistle refresh results for Whistle integration. """
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from dataclasses import asdict
+import gzip
+import json
+import os
+import time
+from typing import Any
+
+from whistleaio.model import Pet, WhistleData
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import DOMAIN, LOGGER, RECORDING_MAX_SIZE
+
+
+def recording_path(hass: HomeAssistant, entry_id: str) -> str:
+    """ Return the path of the traffic recording of a config entry. """
+
+    return hass.config.path(STORAGE_DIR, f'{DOMAIN}.recording.{entry_id}.jsonl.gz')
+
+
+def previous_recording_path(path: str) -> str:
+    """ Return the path a full traffic recording is moved to when a new one is started. """
+
+    return f"{path.removesuffix('.jsonl.gz')}.1.jsonl.gz"
+
+
+class TrafficRecorder:
+    """Append every refresh result to a gzip compressed JSON lines file.
+    Each record is written as its own gzip member, so the file stays
+    readable if Home Assistant stops in the middle of a write. Once the
+    file reaches RECORDING_MAX_SIZE bytes it replaces the previous
+    recording and a new file is started, so at most two files are kept.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        self.hass = hass
+        self.path = path
+        self._lock = asyncio.Lock()
+
+    async def async_record(self, data: WhistleData) -> None:
+        """ Append a timestamped refresh result to the recording. """
+
+        recorded = time.time()
+        async with self._lock:
+            try:
+                await self.hass.async_add_executor_job(self._append, recorded, data)
+            except OSError as error:
+                LOGGER.warning(f'Failed to record Whistle data to {self.path}: {error}')
+
+    def _append(self, recorded: float, data: WhistleData) -> None:
+        """ Serialize and append a single record. Runs in the executor. """
+
+        line = json.dumps(
+            {'time': recorded, 'pets': {pet_id: asdict(pet) for pet_id, pet in data.pets.items()}},
+            separators=(',', ':'),
+            default=str,
+        )
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        try:
+            if os.path.getsize(self.path) >= RECORDING_MAX_SIZE:
+                os.replace(self.path, previous_recording_path(self.path))
+        except FileNotFoundError:
+            pass
+        with gzip.open(self.path, 'at', encoding='utf-8') as file:
+            file.write(line + '\n')
+
+
+def read_recording(path: str) -> Iterator[tuple[float, WhistleData]]:
+    """Yield the timestamp and WhistleData of every record in a recording.
+    A record cut off by an interrupted write ends the recording.
+    """
+
+    with gzip.open(path, 'rt', encoding='utf-8') as file:
+        try:
+            for line in file:
+                record = json.loads(line)
+                yield record['time'], WhistleData(
+                    pets={pet_id: Pet(**pet) for pet_id, pet in record['pets'].items()}
+                )
+        except (EOFError, gzip.BadGzipFile, json.JSONDecodeError) as error:
+            LOGGER.warning(f'Whistle recording {path} ends with an incomplete record: {error}')
+
+
+class ReplayClient:
+    """Stand-in for WhistleClient that serves recorded refresh results.
+    Every endpoint answers from the current record until advance moves
+    on to the next one, so replayed data passes through the same
+    coordinator code as live data.
+    """
+
+    token = "replay"
+
+    def __init__(self, records: Iterator[tuple[float, WhistleData]]) -> None:
+        self._records = records
+        self._pets: dict[str, Pet] = {}
+        self._serials: dict[str, Pet] = {}
+
+    def advance(self) -> float | None:
+        """ Move to the next record. Returns its timestamp, or None at the end of the recording. """
+
+        try:
+            recorded, data = next(self._records)
+        except StopIteration:
+            return None
+        self._pets = data.pets
+        self._serials = {pet.data['device']['serial_number']: pet for pet in data.pets.values()}
+        return recorded
+
+    async def get_pets(self) -> dict[str, Any]:
+        return {'pets': [pet.data for pet in self._pets.values()]}
+
+    async def get_device_data(self, device_serial: str) -> dict[str, Any]:
+        return self._serials[device_serial].device
+
+    async def get_dailies(self, pet_id: int) -> dict[str, Any]:
+        return self._pets[str(pet_id)].dailies
+
+    async def get_dailies_daily_items(self, pet_id: int, day_number: int) -> dict[str, Any]:
+        return self._pets[str(pet_id)].events
+
+    async def get_stats(self, pet_id: int) -> dict[str, Any]:
+        return self._pets[str(pet_id)].stats
+
+    async def get_places(self) -> list[dict[str, Any]]:
+        return next((pet.places for pet in self._pets.values()), [])
+
+    async def get_health_trends(self, pet_id: int) -> dict[str, Any]:
+        return self._pets[str(pet_id)].health
+
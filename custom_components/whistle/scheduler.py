@@ -0,0 +1,145 @@
+""" Refresh scheduling shared by all Whistle config entries. """
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import time
+
+from aiohttp import ClientSession, TCPConnector
+from aiohttp.hdrs import USER_AGENT
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util import ssl as ssl_util
+
+from .const import (
+    CONNECTION_KEEPALIVE,
+    CONNECTION_LIMIT_PER_HOST,
+    DOMAIN,
+    REFRESH_STAGGER,
+    REQUEST_BUDGET_BURST,
+    REQUEST_BUDGET_RATE,
+    SCHEDULER,
+)
+
+
+class RequestBudget:
+    """Token bucket limiting the rate of Whistle requests. Waiting
+    requests are let through in the order they arrived.
+    """
+
+    def __init__(self, rate: float | None, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def async_acquire(self) -> None:
+        """ Wait until a request may be made. """
+
+        if self._rate is None:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._tokens + (now - self._updated) * self._rate, self._burst)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class WhistleScheduler:
+    """Shared by the coordinators of every Whistle config entry. Owns a
+    session with a keep-alive connection pool limited per host, spaces
+    out the start of refreshes across entries, and enforces a request
+    budget for all entries together. Entries that are set up or setting
+    up are counted in users, and the session is closed once none is left.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        stagger: float = REFRESH_STAGGER,
+        request_rate: float | None = REQUEST_BUDGET_RATE,
+        request_burst: int = REQUEST_BUDGET_BURST,
+    ) -> None:
+        self._stagger = stagger
+        self._next_start = 0.0
+        self.users = 0
+        self.budget = RequestBudget(request_rate, request_burst)
+        self.session = ClientSession(
+            connector=TCPConnector(
+                ssl=ssl_util.get_default_context(),
+                limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                keepalive_timeout=CONNECTION_KEEPALIVE,
+            ),
+            headers={USER_AGENT: SERVER_SOFTWARE},
+        )
+        self._remove_close_listener: Callable[[], None] | None = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._async_close_session
+        )
+
+    async def async_wait_for_turn(self) -> None:
+        """Delay a refresh until the stagger interval passed since the
+        previous refresh of any entry started.
+        """
+
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self._stagger
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def async_close(self) -> None:
+        """ Close the shared session. """
+
+        if self._remove_close_listener:
+            self._remove_close_listener()
+            self._remove_close_listener = None
+        await self.session.close()
+
+    async def _async_close_session(self, event: Event) -> None:
+        """ Close the shared session when Home Assistant stops. """
+
+        self._remove_close_listener = None
+        await self.session.close()
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> WhistleScheduler:
+    """ Return the scheduler shared by all Whistle config entries, creating it if needed. """
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if SCHEDULER not in domain_data:
+        domain_data[SCHEDULER] = WhistleScheduler(hass)
+    return domain_data[SCHEDULER]
+
+
+@callback
+def async_acquire_scheduler(hass: HomeAssistant) -> WhistleScheduler:
+    """ Return the shared scheduler and count a config entry using it. """
+
+    scheduler = async_get_scheduler(hass)
+    scheduler.users += 1
+    return scheduler
+
+
+async def async_release_scheduler(hass: HomeAssistant) -> bool:
+    """Stop counting a config entry using the shared scheduler, and close
+    it once no entry uses it. Returns True if it was closed.
+    """
+
+    scheduler = async_get_scheduler(hass)
+    scheduler.users -= 1
+    if scheduler.users > 0:
+        return False
+    domain_data = hass.data[DOMAIN]
+    del domain_data[SCHEDULER]
+    if not domain_data:
+        del hass.data[DOMAIN]
+    await scheduler.async_close()
+    return True
@@ -1,16 +1,15 @@
 """ Sensor platform for Whistle integration."""
 from __future__ import annotations
 
-from typing import Any
-
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
-from zoneinfo import ZoneInfo
-
-from whistleaio.model import Pet
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 
@@ -21,13 +20,250 @@ from homeassistant.const import(
     UnitOfTime,
 )
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, WHISTLE_COORDINATOR
+from .const import (
+    DOMAIN,
+    SECTION_ACTIVITY_SUMMARY,
+    SECTION_DAILIES,
+    SECTION_DEVICE,
+    SECTION_EVENTS,
+    SECTION_HEALTH,
+    WHISTLE_COORDINATOR,
+)
 from .coordinator import WhistleDataUpdateCoordinator
+from .entity import WhistleEntity
+from .model import EventSnapshot, HealthTrendSnapshot, PetSnapshot
+
+
+@dataclass(frozen=True, kw_only=True)
+class WhistleSensorEntityDescription(SensorEntityDescription):
+    """Describes a Whistle sensor entity. The sensor is unavailable
+    while value_fn returns None.
+    """
+
+    sections: frozenset[str]
+    value_fn: Callable[[PetSnapshot], StateType | datetime]
+    attributes_fn: Callable[[PetSnapshot], dict[str, Any]] | None = None
+    icon_fn: Callable[[PetSnapshot], str | None] | None = None
+    gps_only: bool = False
+
+
+def _event_value(
+    value_fn: Callable[[EventSnapshot], StateType | datetime],
+) -> Callable[[PetSnapshot], StateType | datetime]:
+    """ Return a value of the most recent event of today, or None if there is none. """
+
+    return lambda pet: value_fn(pet.event) if pet.event else None
+
+
+def _health_description(
+    key: str,
+    trend_key: str,
+    name: str,
+    icon: str,
+    attributes_fn: Callable[[HealthTrendSnapshot], dict[str, Any]],
+) -> WhistleSensorEntityDescription:
+    """Create the description of a health trend sensor. The state is
+    the formatted trend status and metrics are exposed as attributes.
+    """
+
+    return WhistleSensorEntityDescription(
+        key=key,
+        name=name,
+        icon=icon,
+        sections=frozenset({SECTION_HEALTH}),
+        value_fn=lambda pet: trend.status if (trend := pet.health.get(trend_key)) else None,
+        attributes_fn=lambda pet: attributes_fn(trend) if (trend := pet.health.get(trend_key)) else {},
+    )
+
+
+def _duration(trend: HealthTrendSnapshot) -> dict[str, Any]:
+    """ Return the duration attribute of a health trend. """
+
+    return {'duration': f"{trend.value(0)}s"}
+
+
+SENSORS: tuple[WhistleSensorEntityDescription, ...] = (
+    WhistleSensorEntityDescription(
+        key='24h_wifi_usage',
+        name="24H WiFi battery usage",
+        icon='mdi:wifi',
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        sections=frozenset({SECTION_DEVICE}),
+        value_fn=lambda pet: pet.wifi_usage,
+        gps_only=True,
+    ),
+    WhistleSensorEntityDescription(
+        key='24h_cell_usage',
+        name="24H cellular battery usage",
+        icon='mdi:signal-cellular-outline',
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        sections=frozenset({SECTION_DEVICE}),
+        value_fn=lambda pet: pet.cellular_usage,
+        gps_only=True,
+    ),
+    WhistleSensorEntityDescription(
+        key='battery',
+        name="Battery",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.BATTERY,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        sections=frozenset({SECTION_DEVICE}),
+        value_fn=lambda pet: pet.battery_level,
+    ),
+    WhistleSensorEntityDescription(
+        key='battery_days_left',
+        name="Battery days left",
+        icon='mdi:timer-sand',
+        native_unit_of_measurement=UnitOfTime.DAYS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        sections=frozenset({SECTION_DEVICE}),
+        value_fn=lambda pet: pet.battery_days_left,
+    ),
+    WhistleSensorEntityDescription(
+        key='minutes_active',
+        name="Minutes active",
+        icon='mdi:run-fast',
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        sections=frozenset({SECTION_ACTIVITY_SUMMARY}),
+        value_fn=lambda pet: pet.minutes_active,
+    ),
+    WhistleSensorEntityDescription(
+        key='minutes_rest',
+        name="Minutes rest",
+        icon='mdi:bed-clock',
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL,
+        sections=frozenset({SECTION_ACTIVITY_SUMMARY}),
+        value_fn=lambda pet: pet.minutes_rest,
+    ),
+    WhistleSensorEntityDescription(
+        key='activity_streak',
+        name="Activity streak",
+        icon='mdi:chart-timeline-variant-shimmer',
+        native_unit_of_measurement=UnitOfTime.DAYS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        sections=frozenset({SECTION_ACTIVITY_SUMMARY}),
+        value_fn=lambda pet: pet.activity_streak,
+    ),
+    WhistleSensorEntityDescription(
+        key='activity_goal',
+        name="Activity goal",
+        icon='mdi:flag-checkered',
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        sections=frozenset({SECTION_ACTIVITY_SUMMARY}),
+        value_fn=lambda pet: pet.activity_goal,
+    ),
+    WhistleSensorEntityDescription(
+        key='distance',
+        name="Distance",
+        icon='mdi:map-marker-distance',
+        native_unit_of_measurement=UnitOfLength.MILES,
+        device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        sections=frozenset({SECTION_DAILIES}),
+        value_fn=lambda pet: pet.distance,
+    ),
+    WhistleSensorEntityDescription(
+        key='calories',
+        name="Calories",
+        icon='mdi:fire',
+        native_unit_of_measurement='cal',
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        sections=frozenset({SECTION_DAILIES}),
+        value_fn=lambda pet: pet.calories,
+    ),
+    WhistleSensorEntityDescription(
+        key='last_check_in',
+        name="Last check-in",
+        icon='mdi:server-network',
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        sections=frozenset({SECTION_DEVICE}),
+        value_fn=lambda pet: pet.last_check_in,
+    ),
+    WhistleSensorEntityDescription(
+        key='event',
+        name="Latest event",
+        sections=frozenset({SECTION_EVENTS}),
+        value_fn=_event_value(lambda event: event.title),
+        icon_fn=lambda pet: pet.icon,
+    ),
+    WhistleSensorEntityDescription(
+        key='event_start',
+        name="Event start",
+        icon='mdi:timer-play-outline',
+        device_class=SensorDeviceClass.TIMESTAMP,
+        sections=frozenset({SECTION_EVENTS}),
+        value_fn=_event_value(lambda event: event.start),
+    ),
+    WhistleSensorEntityDescription(
+        key='event_end',
+        name="Event end",
+        icon='mdi:timer-pause-outline',
+        device_class=SensorDeviceClass.TIMESTAMP,
+        sections=frozenset({SECTION_EVENTS}),
+        value_fn=_event_value(lambda event: event.end),
+    ),
+    WhistleSensorEntityDescription(
+        key='event_distance',
+        name="Event distance",
+        icon='mdi:map-marker-distance',
+        native_unit_of_measurement=UnitOfLength.MILES,
+        device_class=SensorDeviceClass.DISTANCE,
+        sections=frozenset({SECTION_EVENTS}),
+        value_fn=_event_value(lambda event: event.distance),
+    ),
+    WhistleSensorEntityDescription(
+        key='event_calories',
+        name="Event calories",
+        icon='mdi:fire',
+        native_unit_of_measurement='cal',
+        state_class=SensorStateClass.TOTAL,
+        sections=frozenset({SECTION_EVENTS}),
+        value_fn=_event_value(lambda event: event.calories),
+    ),
+    WhistleSensorEntityDescription(
+        key='event_duration',
+        name="Event duration",
+        icon='mdi:timer-outline',
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        sections=frozenset({SECTION_EVENTS}),
+        value_fn=_event_value(lambda event: event.duration),
+    ),
+    _health_description('health_scratching', 'scratching', "Scratching", 'mdi:paw', _duration),
+    _health_description('health_licking', 'licking', "Licking", 'mdi:emoticon-tongue-outline', _duration),
+    _health_description('health_drinking', 'drinking', "Drinking", 'mdi:cup', _duration),
+    _health_description(
+        'health_sleeping', 'sleeping', "Sleeping", 'mdi:sleep',
+        lambda trend: {**_duration(trend), 'disruptions': trend.value(1)},
+    ),
+    _health_description('health_eating', 'eating', "Eating", 'mdi:food-drumstick', _duration),
+    _health_description(
+        'health_wellness', 'wellness_index', "Wellness index", 'mdi:heart',
+        lambda trend: {'score': trend.value(0)},
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -36,1803 +272,115 @@ async def async_setup_entry(
 
     coordinator: WhistleDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][WHISTLE_COORDINATOR]
 
-    sensors = []
-
-
-    for pet_id, pet_data in coordinator.data.pets.items():
-            """ Pet """
-            if pet_data.data['device']:
-                """ Only get 24h usage if GPS device. """
-                if pet_data.data['device']['has_gps']:
-                    sensors.extend((
-                        WifiUsage(coordinator, pet_id),
-                        CellUsage(coordinator, pet_id),
-                    ))
-                sensors.extend((
-                    Battery(coordinator, pet_id),
-                    BatteryDaysLeft(coordinator, pet_id),
-                    MinutesActive(coordinator, pet_id),
-                    MinutesRest(coordinator, pet_id),
-                    Streak(coordinator, pet_id),
-                    ActivityGoal(coordinator, pet_id),
-                    Distance(coordinator, pet_id),
-                    Calories(coordinator, pet_id),
-                    LastCheckIn(coordinator, pet_id),
-                    Event(coordinator, pet_id),
-                    EventStart(coordinator, pet_id),
-                    EventEnd(coordinator, pet_id),
-                    EventDistance(coordinator, pet_id),
-                    EventCalories(coordinator, pet_id),
-                    EventDuration(coordinator, pet_id),
-                    HealthScratching(coordinator, pet_id),
-                    HealthLicking(coordinator, pet_id),
-                    HealthDrinking(coordinator, pet_id),
-                    HealthSleeping(coordinator, pet_id),
-                    HealthEating(coordinator, pet_id),
-                    HealthWellnessIdx(coordinator, pet_id)
-                ))
-
-    async_add_entities(sensors)
-
-class Battery(CoordinatorEntity, SensorEntity):
-    """ Representation of Whistle Device Battery. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_battery'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Battery"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def native_value(self) -> int:
-        """ Return battery percentage. """
-
-        return self.pet_data.data['device']['battery_level']
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """ Return percentage as the native unit. """
-
-        return PERCENTAGE
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
-
-        return SensorDeviceClass.BATTERY
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """ Return the type of state class. """
-
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """ Set category to diagnostic. """
-
-        return EntityCategory.DIAGNOSTIC
-
-class BatteryDaysLeft(CoordinatorEntity, SensorEntity):
-    """ Representation of estimated battery life left in days. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_data(self) -> dict[str, Any]:
-        """ Handle coordinator device data. """
-
-        return self.coordinator.data.pets[self.pet_id].device
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_battery_days_left'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Battery days left"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:timer-sand'
-
-    @property
-    def native_value(self) -> float:
-        """ Return estimated days left. """
-
-        return self.device_data['device']['battery_stats']['battery_days_left']
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfTime:
-        """ Return days as the native unit. """
-
-        return UnitOfTime.DAYS
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
-
-        return SensorDeviceClass.DURATION
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """ Return the type of state class. """
-
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """ Set category to diagnostic. """
-
-        return EntityCategory.DIAGNOSTIC
-
-class WifiUsage(CoordinatorEntity, SensorEntity):
-    """ Representation of Whistle Device Battery 24h WiFi usage. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_data(self) -> dict[str, Any]:
-        """ Handle coordinator device data. """
-
-        return self.coordinator.data.pets[self.pet_id].device
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_24h_wifi_usage'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "24H WiFi battery usage"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set entity icon. """
-
-        return 'mdi:wifi'
-
-    @property
-    def native_value(self) -> int:
-        """ Return 24h WiFi battery usage as percentage. """
-
-        return int(round(((float(self.device_data['device']['battery_stats']['prior_usage_minutes']['24h']['power_save_mode']) / 1440) * 100), 0))
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """ Return percentage as the native unit. """
-
-        return PERCENTAGE
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """ Return the type of state class. """
-
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """ Set category to diagnostic. """
-
-        return EntityCategory.DIAGNOSTIC
-
-class CellUsage(CoordinatorEntity, SensorEntity):
-    """ Representation of Whistle Device Battery 24h cellular usage. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_data(self) -> dict[str, Any]:
-        """ Handle coordinator device data. """
-
-        return self.coordinator.data.pets[self.pet_id].device
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_24h_cell_usage'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "24H cellular battery usage"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set entity icon. """
-
-        return 'mdi:signal-cellular-outline'
-
-    @property
-    def native_value(self) -> int:
-        """ Return 24h cellular battery usage as percentage. """
-
-        return int(round(((float(self.device_data['device']['battery_stats']['prior_usage_minutes']['24h']['cellular']) / 1440) * 100), 0))
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """ Return percentage as the native unit. """
-
-        return PERCENTAGE
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """ Return the type of state class. """
-
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """ Set category to diagnostic. """
-
-        return EntityCategory.DIAGNOSTIC
-
-class MinutesActive(CoordinatorEntity, SensorEntity):
-    """ Representation of today's active minutes. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_minutes_active'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Minutes active"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:run-fast'
-
-    @property
-    def native_value(self) -> int:
-        """ Return today's active minutes. """
-
-        return self.pet_data.data['activity_summary']['current_minutes_active']
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfTime:
-        """ Return minutes as the native unit. """
-
-        return UnitOfTime.MINUTES
+    async_add_entities(
+        WhistleSensor(coordinator, pet_id, description)
+        for pet_id, pet in coordinator.snapshots.items()
+        if pet.has_device
+        for description in SENSORS
+        # Only get 24h usage if GPS device.
+        if pet.has_gps or not description.gps_only
+    )
+    async_add_entities([WhistleRefreshSensor(coordinator, entry.entry_id)])
+
+
+class WhistleSensor(WhistleEntity, SensorEntity):
+    """ Representation of a Whistle pet sensor. """
+
+    entity_description: WhistleSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: WhistleDataUpdateCoordinator,
+        pet_id: str,
+        description: WhistleSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, pet_id)
+        self.entity_description = description
+        self._sections = description.sections
+        self._attr_unique_id = f'{pet_id}_{description.key}'
+        self._data_available = True
+        self._update_attrs()
+
+    def _update_attrs(self) -> None:
+        """ Resolve state, attributes, and icon from the latest pet data. """
+
+        pet = self.pet
+        description = self.entity_description
+        value = description.value_fn(pet)
+        self._data_available = value is not None
+        if self._data_available:
+            self._attr_native_value = value
+            if description.attributes_fn:
+                self._attr_extra_state_attributes = description.attributes_fn(pet)
+        if description.icon_fn:
+            self._attr_icon = description.icon_fn(pet)
 
     @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
+    def available(self) -> bool:
+        """ Return True if coordinator succeeded and the pet has data for this sensor. """
 
-        return SensorDeviceClass.DURATION
+        return super().available and self._data_available
 
-    @property
-    def state_class(self) -> SensorStateClass:
-        """ Return the type of state class. """
 
-        return SensorStateClass.TOTAL_INCREASING
+class WhistleRefreshSensor(CoordinatorEntity[WhistleDataUpdateCoordinator], SensorEntity):
+    """Debug sensor reporting the duration of the latest coordinator
+    refresh, with a summary of the buffered refresh metrics as attributes.
+    """
 
-class MinutesRest(CoordinatorEntity, SensorEntity):
-    """ Representation of today's resting minutes. """
+    _attr_has_entity_name = True
+    _attr_name = "Refresh duration"
+    _attr_icon = 'mdi:timer-cog-outline'
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
 
-    def __init__(self, coordinator, pet_id):
+    def __init__(self, coordinator: WhistleDataUpdateCoordinator, entry_id: str) -> None:
         super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_minutes_rest'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Minutes rest"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:bed-clock'
-
-    @property
-    def native_value(self) -> int:
-        """ Return today's rest minutes. """
-
-        return self.pet_data.data['activity_summary']['current_minutes_rest']
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfTime:
-        """ Return minutes as the native unit. """
+        self._attr_unique_id = f'{entry_id}_refresh_duration'
+        self._last_metrics = coordinator.metrics.latest
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name="Whistle",
+            manufacturer="Whistle",
+            entry_type=DeviceEntryType.SERVICE,
+        )
 
-        return UnitOfTime.MINUTES
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """ Write state only after a refresh, not after location-only polls. """
 
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
-
-        return SensorDeviceClass.DURATION
+        if self.coordinator.metrics.latest is not self._last_metrics:
+            self._last_metrics = self.coordinator.metrics.latest
+            self.async_write_ha_state()
 
     @property
-    def state_class(self) -> SensorStateClass:
-        """ Return the type of state class. """
-
-        return SensorStateClass.TOTAL
-
-class Streak(CoordinatorEntity, SensorEntity):
-    """ Representation of activity streak. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
+    def available(self) -> bool:
+        """ Remain available while refreshes fail, so failures can be inspected. """
 
+        return self.coordinator.metrics.latest is not None
 
     @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
+    def native_value(self) -> float | None:
+        """ Return the duration of the latest refresh. """
 
-        return self.coordinator.data.pets[self.pet_id]
+        if (metrics := self.coordinator.metrics.latest) is None:
+            return None
+        return round(metrics.duration_ms, 1)
 
     @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Return details of the latest refresh and a summary of the buffered refreshes. """
 
+        if (metrics := self.coordinator.metrics.latest) is None:
+            return {}
         return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
+            'last_success': metrics.success,
+            'last_error': metrics.error,
+            'bytes_received': metrics.bytes_received,
+            'pets': metrics.pets,
+            'entities_notified': metrics.entities_notified,
+            'state_writes': metrics.state_writes,
+            **self.coordinator.metrics.summary(),
         }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_activity_streak'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Activity streak"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:chart-timeline-variant-shimmer'
-
-    @property
-    def native_value(self) -> int:
-        """ Return current activity streak. """
-
-        return self.pet_data.data['activity_summary']['current_streak']
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfTime:
-        """ Return days as the native unit. """
-
-        return UnitOfTime.DAYS
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
-
-        return SensorDeviceClass.DURATION
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """ Return the type of state class. """
-
-        return SensorStateClass.TOTAL_INCREASING
-
-class ActivityGoal(CoordinatorEntity, SensorEntity):
-    """ Representation of daily activity goal in minutes. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_activity_goal'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Activity goal"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:flag-checkered'
-
-    @property
-    def native_value(self) -> int:
-        """ Return today's active minutes. """
-
-        return self.pet_data.data['activity_summary']['current_activity_goal']['minutes']
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfTime:
-        """ Return minutes as the native unit. """
-
-        return UnitOfTime.MINUTES
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
-
-        return SensorDeviceClass.DURATION
-
-class Distance(CoordinatorEntity, SensorEntity):
-    """ Representation of today's distance in miles. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_distance'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Distance"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:map-marker-distance'
-
-    @property
-    def native_value(self) -> float:
-        """ Return today's distance in miles. """
-
-        return self.pet_data.dailies['dailies'][00]['distance']
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfLength:
-        """ Return miles as the native unit. """
-
-        return UnitOfLength.MILES
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
-
-        return SensorDeviceClass.DISTANCE
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """ Return the type of state class. """
-
-        return SensorStateClass.TOTAL_INCREASING
-
-class Calories(CoordinatorEntity, SensorEntity):
-    """ Representation of today's calories. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_calories'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Calories"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:fire'
-
-    @property
-    def native_value(self) -> int:
-        """ Return today's calories burned. """
-
-        return int(self.pet_data.dailies['dailies'][00]['calories'])
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """ Return calories as the native unit. """
-
-        return 'cal'
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """ Return the type of state class. """
-
-        return SensorStateClass.TOTAL_INCREASING
-
-class LastCheckIn(CoordinatorEntity, SensorEntity):
-    """ Representation of last time device sent data to Whistle servers. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_last_check_in'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Last check-in"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:server-network'
-
-    @property
-    def native_value(self) -> datetime:
-        """ Return last check-in as datetime. """
-        current_tz = self.pet_data.data['profile']['time_zone_name']
-        return datetime.fromisoformat(self.pet_data.data['device']['last_check_in'].replace(' ' + current_tz, '')).replace(tzinfo=ZoneInfo(current_tz)).astimezone()
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
-
-        return SensorDeviceClass.TIMESTAMP
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """ Set category to diagnostic. """
-
-        return EntityCategory.DIAGNOSTIC
-
-class Event(CoordinatorEntity, SensorEntity):
-    """ Representation of latest event. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_event'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Latest event"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        if self.pet_data.data['profile']['species'] == 'dog':
-            return 'mdi:dog'
-        if self.pet_data.data['profile']['species'] == 'cat':
-            return 'mdi:cat'
-
-    @property
-    def native_value(self) -> str:
-        """ Return latest event. """
-
-        return self.pet_data.events['daily_items'][00]['title']
-
-    @property
-    def available(self) -> bool:
-        """ Only return True if an event exists for today. """
-
-        if self.pet_data.events['daily_items']:
-            return True
-        else:
-            return False
-
-class EventStart(CoordinatorEntity, SensorEntity):
-    """ Representation of when last event started. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_event_start'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Event start"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:timer-play-outline'
-
-    @property
-    def native_value(self) -> datetime:
-        """ Return event start time. """
-
-        return datetime.fromisoformat(self.pet_data.events['daily_items'][00]['start_time'].replace('Z', '+00:00')).astimezone()
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
-
-        return SensorDeviceClass.TIMESTAMP
-
-    @property
-    def available(self) -> bool:
-        """ Only return True if an event exists for today. """
-
-        if self.pet_data.events['daily_items']:
-            return True
-        else:
-            return False
-
-class EventEnd(CoordinatorEntity, SensorEntity):
-    """ Representation of when last event ended. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_event_end'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Event end"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:timer-pause-outline'
-
-    @property
-    def native_value(self) -> datetime:
-        """ Return event end time. """
-
-        return datetime.fromisoformat(self.pet_data.events['daily_items'][00]['end_time'].replace('Z', '+00:00')).astimezone()
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
-
-        return SensorDeviceClass.TIMESTAMP
-
-    @property
-    def available(self) -> bool:
-        """ Only return True if an event exists for today. """
-
-        if self.pet_data.events['daily_items']:
-            return True
-        else:
-            return False
-
-class EventDistance(CoordinatorEntity, SensorEntity):
-    """ Representation of distance covered during latest event. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_event_distance'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Event distance"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:map-marker-distance'
-
-    @property
-    def native_value(self) -> float:
-        """ Return event distance in miles. """
-
-        if 'distance' in self.pet_data.events['daily_items'][00]['data']:
-            return self.pet_data.events['daily_items'][00]['data']['distance']
-        else:
-            return 0.0
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfLength:
-        """ Return miles as the native unit. """
-
-        return UnitOfLength.MILES
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
-
-        return SensorDeviceClass.DISTANCE
-
-    @property
-    def available(self) -> bool:
-        """ Only return True if an event exists for today. """
-
-        if self.pet_data.events['daily_items']:
-            return True
-        else:
-            return False
-
-class EventCalories(CoordinatorEntity, SensorEntity):
-    """ Representation of calories burned during latest event. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_event_calories'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Event calories"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:fire'
-
-    @property
-    def native_value(self) -> int:
-        """ Return today's calories burned. """
-
-        if 'calories' in self.pet_data.events['daily_items'][00]['data']:
-            return self.pet_data.events['daily_items'][00]['data']['calories']
-        else:
-            return 0
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """ Return calories as the native unit. """
-
-        return 'cal'
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """ Return the type of state class. """
-
-        return SensorStateClass.TOTAL
-
-    @property
-    def available(self) -> bool:
-        """ Only return True if an event exists for today. """
-
-        if self.pet_data.events['daily_items']:
-            return True
-        else:
-            return False
-
-class EventDuration(CoordinatorEntity, SensorEntity):
-    """ Representation of latest event duration in minutes. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_event_duration'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Event duration"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:timer-outline'
-
-    @property
-    def native_value(self) -> float:
-        """ Return latest event duration in minutes. """
-
-        if 'duration' in self.pet_data.events['daily_items'][00]['data']:
-            return self.pet_data.events['daily_items'][00]['data']['duration']
-        else:
-            return 0.0
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfTime:
-        """ Return minutes as the native unit. """
-
-        return UnitOfTime.MINUTES
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """ Return entity device class. """
-
-        return SensorDeviceClass.DURATION
-
-    @property
-    def available(self) -> bool:
-        """ Only return True if an event exists for today. """
-
-        if self.pet_data.events['daily_items']:
-            return True
-        else:
-            return False
-
-
-class HealthScratching(CoordinatorEntity, SensorEntity):
-    """ Representation of latest scratching metric. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_health_scratching'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Scratching"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:paw'
-
-    @property
-    def native_value(self) -> str:
-        """ Return latest grade. """
-
-        formatted_string = self.pet_data.health['scratching']['status'].replace('_', ' ').capitalize()
-        return formatted_string
-
-    @property
-    def scratching_duration(self) -> int:
-        """Return latest scratching time metric."""
-
-        return self.pet_data.health['scratching']['metrics'][0]['value']
-
-    @property
-    def extra_state_attributes(self) -> dict[str, str]:
-        """Return extra attributes."""
-
-        return {
-            'duration': f'{self.scratching_duration}s'
-        }
-
-    @property
-    def available(self) -> bool:
-        """ Only return True if an event exists for today. """
-
-        if self.pet_data.health['scratching']:
-            return True
-        else:
-            return False
-
-
-class HealthLicking(CoordinatorEntity, SensorEntity):
-    """ Representation of latest licking metric. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_health_licking'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Licking"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:emoticon-tongue-outline'
-
-    @property
-    def native_value(self) -> str:
-        """ Return latest grade. """
-
-        formatted_string = self.pet_data.health['licking']['status'].replace('_', ' ').capitalize()
-        return formatted_string
-
-    @property
-    def licking_duration(self) -> int:
-        """Return latest licking time metric."""
-
-        return self.pet_data.health['licking']['metrics'][0]['value']
-
-    @property
-    def extra_state_attributes(self):
-        """Return extra attributes."""
-
-        return {
-            'duration': f'{self.licking_duration}s'
-        }
-
-    @property
-    def available(self) -> bool:
-        """ Only return True if an event exists for today. """
-
-        if self.pet_data.health['licking']:
-            return True
-        else:
-            return False
-
-
-class HealthDrinking(CoordinatorEntity, SensorEntity):
-    """ Representation of latest drinking metric. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_health_drinking'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Drinking"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:cup'
-
-    @property
-    def native_value(self) -> str:
-        """ Return latest grade. """
-
-        formatted_string = self.pet_data.health['drinking']['status'].replace('_', ' ').capitalize()
-        return formatted_string
-
-    @property
-    def drinking_duration(self) -> int:
-        """Return latest drinking time metric."""
-
-        return self.pet_data.health['drinking']['metrics'][0]['value']
-
-    @property
-    def extra_state_attributes(self):
-        """Return extra attributes."""
-
-        return {
-            'duration': f'{self.drinking_duration}s'
-        }
-
-    @property
-    def available(self) -> bool:
-        """ Only return True if an event exists for today. """
-
-        if self.pet_data.health['drinking']:
-            return True
-        else:
-            return False
-
-
-class HealthSleeping(CoordinatorEntity, SensorEntity):
-    """ Representation of latest sleeping metric. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_health_sleeping'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Sleeping"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:sleep'
-
-    @property
-    def native_value(self) -> str:
-        """ Return latest grade. """
-
-        formatted_string = self.pet_data.health['sleeping']['status'].replace('_', ' ').capitalize()
-        return formatted_string
-
-    @property
-    def sleeping_duration(self) -> int:
-        """Return latest sleeping duration metric."""
-
-        return self.pet_data.health['sleeping']['metrics'][0]['value']
-
-    @property
-    def sleeping_disruptions(self) -> int:
-        """Return latest sleeping disruptions metric."""
-
-        return self.pet_data.health['sleeping']['metrics'][1]['value']
-
-    @property
-    def extra_state_attributes(self):
-        """Return extra attributes."""
-
-        return {
-            'duration': f'{self.sleeping_duration}s',
-            'disruptions': self.sleeping_disruptions
-        }
-
-    @property
-    def available(self) -> bool:
-        """ Only return True if an event exists for today. """
-
-        if self.pet_data.health['sleeping']:
-            return True
-        else:
-            return False
-
-
-class HealthEating(CoordinatorEntity, SensorEntity):
-    """ Representation of latest eating metric. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_health_eating'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Eating"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:food-drumstick'
-
-    @property
-    def native_value(self) -> str:
-        """ Return latest grade. """
-
-        formatted_string = self.pet_data.health['eating']['status'].replace('_', ' ').capitalize()
-        return formatted_string
-
-    @property
-    def eating_duration(self) -> int:
-        """Return latest eating duration metric."""
-
-        return self.pet_data.health['eating']['metrics'][0]['value']
-
-    @property
-    def extra_state_attributes(self):
-        """Return extra attributes."""
-
-        return {
-            'duration': f'{self.eating_duration}s'
-        }
-
-    @property
-    def available(self) -> bool:
-        """ Only return True if an event exists for today. """
-
-        if self.pet_data.health['eating']:
-            return True
-        else:
-            return False
-
-
-class HealthWellnessIdx(CoordinatorEntity, SensorEntity):
-    """ Representation of latest health wellness index. """
-
-    def __init__(self, coordinator, pet_id):
-        super().__init__(coordinator)
-        self.pet_id = pet_id
-
-
-    @property
-    def pet_data(self) -> Pet:
-        """ Handle coordinator pet data. """
-
-        return self.coordinator.data.pets[self.pet_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """ Return device registry information for this entity. """
-
-        return {
-            "identifiers": {(DOMAIN, self.pet_data.id)},
-            "name": self.pet_data.data['name'],
-            "manufacturer": "Whistle",
-            "model": self.pet_data.data['device']['model_id'],
-            "configuration_url": "https://www.whistle.com/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """ Sets unique ID for this entity. """
-
-        return str(self.pet_data.id) + '_health_wellness'
-
-    @property
-    def name(self) -> str:
-        """ Return name of the entity. """
-
-        return "Wellness index"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """ Indicate that entity has name defined. """
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """ Set icon for entity. """
-
-        return 'mdi:heart'
-
-    @property
-    def native_value(self) -> str:
-        """ Return latest grade. """
-
-        formatted_string = self.pet_data.health['wellness_index']['status'].replace('_', ' ').capitalize()
-        return formatted_string
-
-    @property
-    def wellness_score(self) -> int:
-        """Return latest wellness index score."""
-
-        return self.pet_data.health['wellness_index']['metrics'][0]['value']
-
-    @property
-    def extra_state_attributes(self):
-        """Return extra attributes."""
-
-        return {
-            'score': self.wellness_score
-        }
-
-    @property
-    def available(self) -> bool:
-        """ Only return True if an event exists for today. """
-
-        if self.pet_data.health['wellness_index']:
-            return True
-        else:
-            return False
@@ -0,0 +1,148 @@
+""" Services for Whistle integration. """
+from __future__ import annotations
+
+from datetime import timedelta
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    PERIOD_DAY,
+    PERIODS,
+    SERVICE_GET_HISTORY,
+    SERVICE_GET_TRACK,
+    TRACK_TOLERANCE,
+    WHISTLE_COORDINATOR,
+)
+from .coordinator import WhistleDataUpdateCoordinator
+from .history import date_to_day
+
+ATTR_END = "end"
+ATTR_END_DATE = "end_date"
+ATTR_PERIOD = "period"
+ATTR_START = "start"
+ATTR_START_DATE = "start_date"
+ATTR_TOLERANCE = "tolerance"
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+        vol.Optional(ATTR_PERIOD, default=PERIOD_DAY): vol.In(PERIODS),
+    }
+)
+
+GET_TRACK_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_TOLERANCE, default=TRACK_TOLERANCE): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+
+@callback
+def async_register_services(hass: HomeAssistant) -> None:
+    """ Register Whistle services, unless another config entry already did. """
+
+    if hass.services.has_service(DOMAIN, SERVICE_GET_HISTORY):
+        return
+
+    async def async_get_history(call: ServiceCall) -> ServiceResponse:
+        """ Return the daily, weekly, or monthly history of a pet. """
+
+        coordinator, pet_id, name = _pet_from_call(hass, call)
+        start = call.data[ATTR_START_DATE]
+        end = call.data.get(ATTR_END_DATE, dt_util.now().date())
+        if start > end:
+            raise ServiceValidationError("start_date must not be after end_date")
+        history = coordinator.history.pets.get(pet_id)
+        return {
+            'pet_id': pet_id,
+            'name': name,
+            ATTR_PERIOD: call.data[ATTR_PERIOD],
+            'history': history.query(date_to_day(start), date_to_day(end), call.data[ATTR_PERIOD])
+            if history else [],
+        }
+
+    async def async_get_track(call: ServiceCall) -> ServiceResponse:
+        """Return the GPS track of a pet as [time, latitude, longitude,
+        accuracy] points, by default over the last day.
+        """
+
+        coordinator, pet_id, name = _pet_from_call(hass, call)
+        end = dt_util.as_utc(call.data[ATTR_END]) if ATTR_END in call.data else dt_util.utcnow()
+        start = dt_util.as_utc(call.data[ATTR_START]) if ATTR_START in call.data else end - timedelta(days=1)
+        if start > end:
+            raise ServiceValidationError("start must not be after end")
+        points = coordinator.tracks.query(
+            pet_id, start.timestamp(), end.timestamp(), call.data[ATTR_TOLERANCE]
+        )
+        return {
+            'pet_id': pet_id,
+            'name': name,
+            'track': [
+                [dt_util.utc_from_timestamp(time).isoformat(), latitude, longitude, accuracy]
+                for time, latitude, longitude, accuracy in points
+            ],
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TRACK,
+        async_get_track,
+        schema=GET_TRACK_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+@callback
+def async_unregister_services(hass: HomeAssistant) -> None:
+    """ Remove Whistle services once the last config entry is unloaded. """
+
+    hass.services.async_remove(DOMAIN, SERVICE_GET_HISTORY)
+    hass.services.async_remove(DOMAIN, SERVICE_GET_TRACK)
+
+
+def _pet_from_call(
+    hass: HomeAssistant, call: ServiceCall
+) -> tuple[WhistleDataUpdateCoordinator, str, str | None]:
+    """ Return the coordinator, pet id, and name of the pet device a service was called for. """
+
+    device = dr.async_get(hass).async_get(call.data[ATTR_DEVICE_ID])
+    pet_id = next(
+        (identifier for domain, identifier in device.identifiers if domain == DOMAIN), None
+    ) if device else None
+    coordinator = _coordinator_for_pet(hass, pet_id) if pet_id else None
+    if coordinator is None:
+        raise ServiceValidationError(f'{call.data[ATTR_DEVICE_ID]} is not a Whistle pet')
+    return coordinator, pet_id, device.name
+
+
+def _coordinator_for_pet(hass: HomeAssistant, pet_id: str) -> WhistleDataUpdateCoordinator | None:
+    """ Find the coordinator of the config entry a pet belongs to. """
+
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if not isinstance(entry_data, dict):
+            continue
+        coordinator: WhistleDataUpdateCoordinator = entry_data[WHISTLE_COORDINATOR]
+        if coordinator.data and pet_id in coordinator.data.pets:
+            return coordinator
+    return None
@@ -0,0 +1,154 @@
+""" Long-term statistics of Whistle dailies for Whistle integration. """
+from __future__ import annotations
+
+from bisect import bisect_left
+import math
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics, get_last_statistics
+from homeassistant.const import UnitOfLength
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, LOGGER
+from .history import HistoryStore, PetHistory, date_to_day, day_to_date
+
+""" History column, statistic name, and unit of every imported statistic. """
+STATISTICS: tuple[tuple[str, str, str], ...] = (
+    ('distance', "Distance", UnitOfLength.MILES),
+    ('calories', "Calories", 'cal'),
+)
+
+
+def statistic_id(pet_id: str, column: str) -> str:
+    """ Return the id of the external statistic of a pet's history column. """
+
+    return f'{DOMAIN}:{pet_id}_{column}'
+
+
+class StatisticsImporter:
+    """Imports the daily distance and calories of every pet into the
+    long-term statistics of the recorder, one row per day. The first
+    import of a pet after startup reads the last row the recorder holds
+    and continues its sum from there, so statistics never step back if
+    the local history was lost or recreated. Later imports only start at
+    the first day whose totals changed. Importing a day again replaces its
+    row, so imports can safely overlap.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._imported: set[str] = set()
+        # First day to import and the sum of all days before it, per statistic.
+        self._anchors: dict[str, tuple[int, float]] = {}
+
+    @callback
+    def async_import(self, history: HistoryStore, names: dict[str, str]) -> None:
+        """ Queue statistics of days that changed since the previous import. """
+
+        if 'recorder' not in self.hass.config.components:
+            history.changed_days.clear()
+            return
+        for pet_id, pet_history in history.pets.items():
+            first_day = history.changed_days.pop(pet_id, None)
+            if pet_id not in names or not len(pet_history):
+                continue
+            if pet_id not in self._imported:
+                self._imported.add(pet_id)
+                self.hass.async_create_background_task(
+                    self._async_import_new(pet_id, pet_history, names[pet_id]),
+                    f'{DOMAIN}_import_statistics_{pet_id}',
+                )
+            elif first_day is not None:
+                for column, statistic_name, unit in STATISTICS:
+                    self._import(
+                        pet_id, pet_history, f'{names[pet_id]} {statistic_name}', column, unit, first_day
+                    )
+
+    async def _async_import_new(self, pet_id: str, history: PetHistory, name: str) -> None:
+        """Anchor every statistic of a pet to the last row the recorder
+        holds and import the days from there on.
+        """
+
+        for column, statistic_name, unit in STATISTICS:
+            last = await get_instance(self.hass).async_add_executor_job(
+                get_last_statistics, self.hass, 1, statistic_id(pet_id, column), False, {'state', 'sum'}
+            )
+            rows = last.get(statistic_id(pet_id, column))
+            if not rows:
+                anchor = (history.days[0], 0.0)
+            else:
+                last_day = date_to_day(dt_util.as_local(dt_util.utc_from_timestamp(rows[0]['start'])).date())
+                last_sum = rows[0].get('sum') or 0.0
+                if math.isnan(_value(history, column, last_day)):
+                    # The day is not in the local history, keep its row and continue after it.
+                    anchor = (last_day + 1, last_sum)
+                else:
+                    # Replace the row of the last day, which may have been imported before it ended.
+                    anchor = (last_day, last_sum - (rows[0].get('state') or 0.0))
+            self._anchors[statistic_id(pet_id, column)] = anchor
+            self._import(pet_id, history, f'{name} {statistic_name}', column, unit, anchor[0])
+
+    @callback
+    def _import(
+        self, pet_id: str, history: PetHistory, name: str, column: str, unit: str, first_day: int
+    ) -> None:
+        """Queue the statistics of a history column from first_day on, but
+        not before its anchor. Does nothing until the anchor is known.
+        """
+
+        if (anchor := self._anchors.get(statistic_id(pet_id, column))) is None:
+            return
+        statistics = _statistics(history, column, max(first_day, anchor[0]), *anchor)
+        if not statistics:
+            return
+        async_add_external_statistics(
+            self.hass,
+            StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=name,
+                source=DOMAIN,
+                statistic_id=statistic_id(pet_id, column),
+                unit_of_measurement=unit,
+            ),
+            statistics,
+        )
+        LOGGER.debug(f'Queued Whistle statistics {statistic_id(pet_id, column)} from {day_to_date(first_day)}')
+
+
+def _value(history: PetHistory, column: str, day: int) -> float:
+    """ Return the value of a history column on a day, or NaN if the day is missing. """
+
+    index = bisect_left(history.days, day)
+    if index == len(history.days) or history.days[index] != day:
+        return math.nan
+    return history.columns[column][index]
+
+
+def _statistics(
+    history: PetHistory, column: str, first_day: int, anchor_day: int, anchor_sum: float
+) -> list[StatisticData]:
+    """Build a row per day from first_day on. The sum starts at
+    anchor_sum on anchor_day and adds every later day, and days without a
+    value are skipped.
+    """
+
+    values = history.columns[column]
+    total = anchor_sum
+    statistics: list[StatisticData] = []
+    for day, value in zip(history.days, values):
+        if day < anchor_day or math.isnan(value):
+            continue
+        total += value
+        if day < first_day:
+            continue
+        statistics.append(
+            StatisticData(
+                start=dt_util.start_of_local_day(day_to_date(day)),
+                state=round(value, 2),
+                sum=round(total, 2),
+            )
+        )
+    return statistics
@@ -0,0 +1,145 @@
+""" GPS track of every pet for Whistle integration. """
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Sequence
+import math
+from typing import Any
+
+from whistleaio.model import WhistleData
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    SECTION_LAST_LOCATION,
+    STORAGE_VERSION,
+    TRACK_SAVE_DELAY,
+    TRACK_SIZE,
+)
+
+EARTH_RADIUS = 6371008.8
+
+""" A fix as (unix timestamp, latitude, longitude, accuracy in meters). """
+TrackPoint = tuple[float, float, float, float]
+
+
+def track_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """ Return the store holding the tracks of a config entry. """
+
+    return Store(hass, STORAGE_VERSION, f'{DOMAIN}.track.{entry_id}')
+
+
+def simplify(points: Sequence[TrackPoint], tolerance: float) -> list[TrackPoint]:
+    """Simplify a track with the Douglas-Peucker algorithm, dropping
+    points closer than tolerance meters to the line between the points
+    that are kept. Positions are projected to meters around the first
+    point, which is accurate enough for the length of a walk.
+    """
+
+    if tolerance <= 0 or len(points) < 3:
+        return list(points)
+
+    latitude = math.radians(points[0][1])
+    scale_x = math.radians(1) * EARTH_RADIUS * math.cos(latitude)
+    scale_y = math.radians(1) * EARTH_RADIUS
+    xy = [(point[2] * scale_x, point[1] * scale_y) for point in points]
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        (x1, y1), (x2, y2) = xy[first], xy[last]
+        dx, dy = x2 - x1, y2 - y1
+        length = math.hypot(dx, dy)
+        farthest, distance = 0, 0.0
+        for index in range(first + 1, last):
+            x, y = xy[index]
+            if length:
+                offset = abs(dy * (x - x1) - dx * (y - y1)) / length
+            else:
+                offset = math.hypot(x - x1, y - y1)
+            if offset > distance:
+                farthest, distance = index, offset
+        if distance > tolerance:
+            keep[farthest] = True
+            stack.append((first, farthest))
+            stack.append((farthest, last))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def _point(location: dict[str, Any]) -> TrackPoint | None:
+    """ Convert the last location of a pet to a track point. """
+
+    try:
+        return (
+            dt_util.parse_datetime(location['timestamp']).timestamp(),
+            float(location['latitude']),
+            float(location['longitude']),
+            float(location.get('uncertainty_meters') or 0),
+        )
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TrackStore:
+    """Ring buffer of the most recent location fixes of every pet. A fix
+    is added whenever the last location of a pet changes to a newer
+    timestamp, and the buffers are saved together TRACK_SAVE_DELAY
+    seconds after the first change since the previous save.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store = track_store(hass, entry_id)
+        self.pets: dict[str, deque[TrackPoint]] = {}
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """ Load the saved tracks. """
+
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        try:
+            self.pets = {
+                pet_id: deque((tuple(point) for point in points), maxlen=TRACK_SIZE)
+                for pet_id, points in stored['pets'].items()
+            }
+        except (KeyError, TypeError, AttributeError) as error:
+            LOGGER.warning(f'Ignoring invalid Whistle tracks: {error}')
+
+    @callback
+    def async_update(self, data: WhistleData, changed_sections: dict[str, frozenset[str]]) -> None:
+        """ Add the last location of every pet whose location changed. """
+
+        changed = False
+        for pet_id, pet in data.pets.items():
+            if SECTION_LAST_LOCATION not in changed_sections.get(pet_id, frozenset()):
+                continue
+            point = _point(pet.data.get('last_location') or {})
+            if point is None:
+                continue
+            track = self.pets.setdefault(pet_id, deque(maxlen=TRACK_SIZE))
+            if track and track[-1][0] >= point[0]:
+                continue
+            track.append(point)
+            changed = True
+        if changed and not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data, TRACK_SAVE_DELAY)
+
+    def query(self, pet_id: str, start: float, end: float, tolerance: float) -> list[TrackPoint]:
+        """ Return the simplified track of a pet between two unix timestamps, inclusive. """
+
+        points = [point for point in self.pets.get(pet_id, ()) if start <= point[0] <= end]
+        return simplify(points, tolerance)
+
+    def _data(self) -> dict[str, Any]:
+        """ Return the tracks to save, once the store writes them. """
+
+        self._save_pending = False
+        return {'pets': {pet_id: list(points) for pet_id, points in self.pets.items()}}
@@ -1,31 +1,33 @@
 """ Utilities for Whistle Integration """
 from __future__ import annotations
 
-
+from datetime import datetime
+from functools import lru_cache
+import json
+import time
+from typing import Any
 
 import async_timeout
-from whistleaio import WhistleClient
 from whistleaio.exceptions import WhistleAuthError
-from whistleaio.model import Pet, WhistleData
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
 
-from .const import LOGGER, WHISTLE_ERRORS, TIMEOUT
+from .api import create_client
+from .const import LOGGER, PETS_CACHE, PETS_CACHE_MAX_AGE, TIMESTAMP_CACHE_SIZE, WHISTLE_ERRORS, TIMEOUT
 
-async def async_validate_api(hass: HomeAssistant, email: str, password: str) -> bool:
-    """ Get data from API. """
+async def async_validate_api(hass: HomeAssistant, email: str, password: str) -> tuple[str, dict[str, Any]]:
+    """Log in and list the pets of the account, without fetching any
+    pet details. Returns the auth token and the pets response so both
+    can be reused by the coordinator.
+    """
 
-    client = WhistleClient(
-        email,
-        password,
-        session=async_get_clientsession(hass),
-        timeout=TIMEOUT,
-    )
+    client = create_client(hass, email, password)
 
     try:
         async with async_timeout.timeout(TIMEOUT):
-            whistle_query = await client.get_whistle_data()
+            await client.get_token()
+            response = await client.get_pets()
     except WhistleAuthError as err:
         LOGGER.error(f'Could not authenticate on Whistle servers: {err}')
         raise WhistleAuthError from err
@@ -33,12 +35,53 @@ async def async_validate_api(hass: HomeAssistant, email: str, password: str) ->
         LOGGER.error(f'Failed to get information from Whistle servers: {err}')
         raise ConnectionError from err
 
-    pets: dict[str, Pet] = whistle_query.pets
-    if not pets:
+    if not response.get('pets'):
         LOGGER.error("Could not retrieve any pets from Whistle servers")
         raise NoPetsError
-    else:
-        return True
+    LOGGER.debug(f'Validated Whistle account with pets {[pet["id"] for pet in response["pets"]]}')
+    return client.token, response
+
+
+@callback
+def async_cache_pets(hass: HomeAssistant, email: str, response: dict[str, Any]) -> None:
+    """ Keep a pets response from validation so the first refresh of the entry can reuse it. """
+
+    hass.data.setdefault(PETS_CACHE, {})[email] = (time.monotonic(), response)
+
+
+@callback
+def async_pop_cached_pets(hass: HomeAssistant, email: str) -> dict[str, Any] | None:
+    """ Return and forget a cached pets response, if it is recent enough to reuse. """
+
+    cached = hass.data.get(PETS_CACHE, {}).pop(email, None)
+    if cached is None or time.monotonic() - cached[0] > PETS_CACHE_MAX_AGE:
+        return None
+    return cached[1]
+
+
+def fingerprint(value: Any) -> int:
+    """ Create a hash of a JSON-like payload that is independent of key order. """
+
+    return hash(json.dumps(value, sort_keys=True, separators=(',', ':'), default=str))
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_local_timestamp(value: str, zone: str) -> datetime:
+    """Parse a timestamp such as '2024-01-05 15:01:45 America/New_York'
+    in the given time zone to an aware datetime in local time. Raises
+    KeyError for an unknown time zone.
+    """
+
+    if (tzinfo := dt_util.get_time_zone(zone)) is None:
+        raise KeyError(zone)
+    return datetime.fromisoformat(value.replace(' ' + zone, '')).replace(tzinfo=tzinfo).astimezone()
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_timestamp(value: str) -> datetime:
+    """ Parse an ISO 8601 timestamp such as '2024-01-05T15:01:45Z' to an aware datetime in local time. """
+
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).astimezone()
 
 
 class NoPetsError(Exception):
@@ -0,0 +1,41 @@
+""" Tests for the event log of Whistle integration. """
+from __future__ import annotations
+
+from custom_components.whistle.events import PetEventLog
+
+
+def _walk(end_time: str | None, distance: float) -> dict:
+    """ Return a walk daily item as Whistle lists it. """
+
+    return {
+        'type': 'walk',
+        'title': "Walk",
+        'start_time': '2024-01-05T14:00:00Z',
+        'end_time': end_time,
+        'data': {'distance': distance},
+    }
+
+
+def test_new_events_are_reported_once() -> None:
+    """ Events already in the log are not reported again. """
+
+    log = PetEventLog(10)
+    play = {'id': 1, 'type': 'play', 'start_time': '2024-01-05T10:00:00Z', 'end_time': '2024-01-05T10:10:00Z'}
+    walk = {'id': 2, 'type': 'walk', 'start_time': '2024-01-05T12:00:00Z', 'end_time': '2024-01-05T12:30:00Z'}
+
+    assert log.add([walk, play]) == [play, walk]
+    assert log.add([walk, play]) == []
+
+
+def test_running_event_is_reported_again_when_finished() -> None:
+    """ A running event is reported again with its final data once it has an end time. """
+
+    log = PetEventLog(10)
+    running = _walk(None, 0.4)
+    finished = _walk('2024-01-05T14:45:00Z', 1.2)
+
+    assert log.add([running]) == [running]
+    assert log.add([running]) == []
+    assert log.add([finished]) == [finished]
+    assert list(log.events) == [finished]
+    assert log.add([finished]) == []